@@ -24,7 +24,19 @@ from ..typetools import parse_bool
 log = loggingtools.getLogger()
 
 
-def get_config_value(property_name, default=None, secure=False, val_type=None):
+def get_config_values_by_prefix(prefix):
+    """
+    Returns all of the configuration properties defined through the available configuration systems whose name starts
+    with `prefix`.  This is gathered in a single pass so that the result can be provided as the `source` of multiple
+    `get_config_value` calls for related properties.
+    :param prefix: The prefix of the configuration property names to retrieve.
+    :return: A dict of the matching configuration property names to their raw values.
+    :rtype: dict
+    """
+    return {name: val for name, val in os.environ.items() if name.startswith(prefix)}
+
+
+def get_config_value(property_name, default=None, secure=False, val_type=None, source=None):
     """
     Returns the value for the provided configuration property if it is defined through the available configuration
     systems otherwise `default` is returned.
@@ -35,11 +47,15 @@ def get_config_value(property_name, default=None, secure=False, val_type=None):
     :param val_type: The data type to cast the value to.  This can be a single value or an iterable of types to attempt
                         to cast the value to in the order they are provided.  If this is not provided and a value is
                         provided for `default` then the type of that value will be used.
+    :param source: A dict of configuration properties as returned from `get_config_values_by_prefix` to retrieve the
+                    value from.  If this is not provided then the available configuration systems are used directly.
     :return: The value of the configuration property `property_name`.
     """
     # pylint: disable=too-many-branches
-    if property_name in os.environ:
-        val = os.environ[property_name]
+    if source is None:
+        source = os.environ
+    if property_name in source:
+        val = source[property_name]
         location = "ENVIRONMENT"
     else:
         val = default
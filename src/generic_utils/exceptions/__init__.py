@@ -2,7 +2,51 @@
 """
 from __future__ import absolute_import
 
-from generic_utils.classtools import get_class_attributes
+# stdlib
+import inspect
+import re
+import string
+
+_FORMATTER = string.Formatter()
+
+#: Matches the attribute/index access portion of a format field name (e.g. ".name" in "{value.name}")
+_FIELD_ACCESSOR_RE = re.compile(r"[.\[]")
+
+#: Cache of the names referenced by exception class message templates keyed by the message template
+_message_field_names = {}  # pylint: disable=invalid-name
+
+
+def _get_message_field_names(message, cache=False):
+    """Returns the names of the keyword fields referenced by the format string `message`, including any nested within a
+    format spec.
+
+    :param message: The format string to get the field names of
+    :param cache: Whether or not to cache the result for `message`.  This should only be done for message templates
+        defined on exception classes as any other message may be unique to an exception instance.
+    :rtype: frozenset
+    """
+    try:
+        return _message_field_names[message]
+    except KeyError:
+        pass
+
+    field_names = set()
+    for _, field_name, format_spec, _ in _FORMATTER.parse(message):
+        if field_name:
+            field_names.add(_FIELD_ACCESSOR_RE.split(field_name, 1)[0])
+        if format_spec:
+            field_names.update(_get_message_field_names(format_spec))
+    field_names = frozenset(field_names)
+
+    if cache:
+        _message_field_names[message] = field_names
+    return field_names
+
+
+def _is_method_or_descriptor(value):
+    """Whether or not the class attribute `value` is a method or property which is not available for message formatting
+    """
+    return inspect.isroutine(value) or inspect.isgetsetdescriptor(value) or inspect.isdatadescriptor(value)
 
 
 class GenUtilsException(Exception):
@@ -43,10 +87,24 @@ class GenUtilsException(Exception):
             else:
                 message = self.message
 
-        # Get class defined attributes and values
-        attrs = get_class_attributes(self.__class__, include_base_attrs=True, include_private=False)
-        attrs.update(self.__dict__)
-        return message.format(**attrs) if message else None
+        if not message:
+            return None
+
+        # Only the attributes which are actually referenced by the message are resolved, rather than collecting all of
+        # the attributes of the class hierarchy for every exception instance
+        attrs = {}
+        instance_attrs = self.__dict__
+        for field_name in _get_message_field_names(message, cache=message is type(self).message):
+            if field_name in instance_attrs:
+                attrs[field_name] = instance_attrs[field_name]
+            elif not field_name.startswith("_"):
+                try:
+                    value = getattr(type(self), field_name)
+                except AttributeError:
+                    continue
+                if not _is_method_or_descriptor(value):
+                    attrs[field_name] = value
+        return message.format(**attrs)
 
     def _set_kwargs(self, kwargs):
         """Sets the values of the kwargs of the init of the exception as attributes on the exception instance
@@ -1,5 +1,8 @@
 """Classes to define ExecutionContext concepts which contain any special configuration / context data needed at runtime
 """
+# future/compat
+from six.moves import cPickle as pickle
+
 # stdlib
 import copy
 
@@ -16,6 +19,9 @@ from generic_utils.typetools import as_iterable
 
 LOG = loggingtools.getLogger()
 
+#: Sentinel passed as the default to each context on the stack so a miss can be detected without an exception
+_MISSING = object()
+
 
 class BaseExecutionContext(object):
     """Defines an API for storing / getting values into an "ExecutionContext" which may be stored in various backends
@@ -299,19 +305,16 @@ class ExecutionContextStack(BaseExecutionContext):
         :raises: ExecutionContextValueDoesNotExist
         :rtype:
         """
-        LOG.debug("Attempting to get value for key=%s from ExecutionContextStack.", key)
-        index = 0
-        for execution_ctx in reversed(self.current_stack):
-            try:
-                result = execution_ctx.get(key)
-                LOG.debug("Got result=%s from ExecutionContext=%s with index=%s for key=%s", result, execution_ctx,
-                          index, key)
+        # Most lookups are answered by the context at the top of the stack, so ask each context for the key with a
+        # sentinel default rather than paying for a raised/caught ExecutionContextValueDoesNotExist per miss.
+        current_stack = self.current_stack
+        for execution_ctx in reversed(current_stack):
+            result = execution_ctx.get(key, _MISSING)
+            if result is not _MISSING:
                 return result
-            except ExecutionContextValueDoesNotExist:
-                index += 1
-                continue
 
-        LOG.debug("Could not get value for key=%s from current stack, checked %s ExecutionContexts", key, index + 1)
+        LOG.debug("Could not get value for key=%s from current stack, checked %s ExecutionContexts", key,
+                  len(current_stack))
 
         if default == NOTSET:
             raise ExecutionContextValueDoesNotExist(key=key)
@@ -378,9 +381,10 @@ class ExecutionContextStack(BaseExecutionContext):
         if not isinstance(execution_context, BaseExecutionContext):
             raise GenUtilsTypeError(argument='execution_context', type_name=type(execution_context))
 
-        if execution_context in self.current_stack:
+        current_stack = self.current_stack
+        if execution_context in current_stack:
             raise GenUtilsValueError(value_name='execution_context')
-        self.current_stack.append(execution_context)
+        current_stack.append(execution_context)
 
     def pop(self, index=None):
         """Pops execution_context at `index` from current execution context stack
@@ -439,12 +443,14 @@ class ExecutionContextStack(BaseExecutionContext):
         :rtype: [BaseExecutionContext]
         :raises:GenUtilsValueError
         """
-        if raise_exception is True and exec_context not in self.current_stack:
+        current_stack = self.current_stack
+        if raise_exception is True and exec_context not in current_stack:
             raise GenUtilsValueError("ExecutionContext=%r is not in the current_stack, can not continue." % exec_context)
 
         popped_items = []
-        while self.current_stack[-1] != exec_context:
-            popped_items.append(self.pop())
+        pop = current_stack.pop
+        while current_stack[-1] != exec_context:
+            popped_items.append(pop())
         return popped_items
 
     def clear(self):
@@ -466,6 +472,29 @@ class ExecutionContextStack(BaseExecutionContext):
 execution_context_stack = ExecutionContextStack()  # pylint: disable=invalid-name
 
 
+def snapshot(execution_context):
+    """Serializes `execution_context` with the C pickler for handing off within the same process or between trusted
+    processes.  Use `generic_utils.json_tools.serialization.dumps` for anything that goes over the wire.
+
+    :param execution_context:
+    :type execution_context: BaseExecutionContext
+    :return: The pickled execution context
+    :rtype: bytes
+    """
+    return pickle.dumps(execution_context, pickle.HIGHEST_PROTOCOL)
+
+
+def restore(blob):
+    """Restores an execution context previously serialized with `snapshot`.  Never call with untrusted data.
+
+    :param blob:
+    :type blob: bytes
+    :return:
+    :rtype: BaseExecutionContext
+    """
+    return pickle.loads(blob)
+
+
 class AsExecutionContext(ExplicitContextDecorator):
     """Supports injecting ExecutionContext data to be restored on the ExecutionContextStack when
     entering/exiting a decorator or context manager.
@@ -10,7 +10,8 @@ from generic_utils import five
 def get_chunked_hash(filelike_obj, chunk_size=8192, hash_func=hashlib.sha256):
     """Iteratively reads chunks from a stream , `filelike_obj` to generate a hash
 
-    :param filelike_obj: a streaming object which has a read() method.
+    :param filelike_obj: a streaming object which has a read() method.  If it also has a readinto() method, such as
+        binary file objects and `io.BytesIO`, then that is used to read the chunks.
     :type filelike_obj:
     :param chunk_size:
     :type chunk_size: int
@@ -21,6 +22,19 @@ def get_chunked_hash(filelike_obj, chunk_size=8192, hash_func=hashlib.sha256):
     """
     filelike_obj.seek(0)
     hasher = hash_func()
+
+    readinto = getattr(filelike_obj, "readinto", None)
+    if readinto is not None:
+        # Binary streams are read into a single reusable buffer rather than allocating a new bytes object per chunk
+        buf = bytearray(chunk_size)
+        view = memoryview(buf)
+        while True:
+            size = readinto(buf)
+            if not size:
+                break
+            hasher.update(view[:size])
+        return hasher.hexdigest()
+
     while True:
         data = filelike_obj.read(chunk_size)
         if not data:
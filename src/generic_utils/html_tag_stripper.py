@@ -17,16 +17,12 @@ def strip_tags(html):
     """
     soup = bs4.BeautifulSoup(html, "lxml")
 
-    # Remove script tag and its content
-    if soup.script:
-        soup.script.decompose()
-
-    # Remove CDATA and its content
-    # CData is a special subclass of "navigable strings" and it does not have decompose().
-    for element in soup.find_all(text=True):
-        if isinstance(element, bs4.CData):
-            element.replace_with('')
+    # The text is gathered in a single pass over the parsed document rather than removing the script tags and CDATA from
+    # the tree and then walking it again to get the text.  The exact type check excludes CData (and comments) which are
+    # special subclasses of "navigable strings".
+    text = u"".join(element for element in soup.descendants
+                    if type(element) is bs4.NavigableString and element.parent.name != "script")
 
     # According to http://www.crummy.com/software/BeautifulSoup/bs4/doc/#entities
     # BeautifulSoup4 produces proper Unicode for all entities, meaning '&nbsp;' is converted to u'\xa0'.
-    return soup.get_text().replace(u"\xa0", " ").replace("\n", "")
+    return text.replace(u"\xa0", " ").replace("\n", "")
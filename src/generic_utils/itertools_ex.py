@@ -5,14 +5,14 @@ from builtins import object
 from builtins import range
 from builtins import zip
 
-# stdlib
-from inspect import getmembers
-
 from generic_utils import loggingtools
 from generic_utils.exceptions import GenUtilsTypeError
 
 LOG = loggingtools.getLogger()
 
+_CALLBACK_SUFFIX = "_callback"
+_MISSING = object()
+
 
 class IteratorProxy(object):
     """A proxy object to support iterating over a set of data and applying transform function `transform_func`
@@ -33,7 +33,6 @@ class IteratorProxy(object):
 
     """
     _proxied_data = None
-    _dataiterator_stack = None
     item_processor = None
 
     def __init__(self, data, item_processor=None):
@@ -50,46 +49,23 @@ class IteratorProxy(object):
         self.item_processor = item_processor
 
     def __iter__(self):
-        """Set the dataiterator stack
+        """Iterate over the proxied data, applying `item_processor` to each row and flattening any nested
+        IteratorProxy objects into the output.  Rows which end up as None are skipped.
         :return:
-        :rtype:
+        :rtype: collections.Iterator
         """
         LOG.debug("iter called on %r", self)
-        self._dataiterator_stack = [iter(self._proxied_data)]
-        return self
-
-    def __next__(self):
-        """
-        :return:
-        :rtype:
-        """
-        response = None
-
-        while response is None:
-            data_generator = self._dataiterator_stack[-1]
-            try:
-                response = next(data_generator)
-                LOG.debug("Raw response = %r", response)
-            except StopIteration:
-                if len(self._dataiterator_stack) > 1:
-                    self._dataiterator_stack.remove(data_generator)
-                    LOG.debug("Removed %r from _dataiterator_stack", data_generator)
-                    continue
-                else:
-                    LOG.debug("Raising StopIteration on %r", self)
-                    raise
-
-            if self.item_processor is not None and not isinstance(data_generator, IteratorProxy):
-                # Do not call the transform on a response from an IteratorProxy
-                response = self.item_processor(response)
+        item_processor = self.item_processor
+        for response in self._proxied_data:
+            if item_processor is not None:
+                response = item_processor(response)
 
             if isinstance(response, IteratorProxy):
-                LOG.debug("Response is an IteratorProxy object, appending to DataIterator stack.")
-                # Must call iter on the IteratorProxy object in order to set it up for calling next() method
-                self._dataiterator_stack.append(iter(response))
-                response = None
-
-        return response
+                # A nested IteratorProxy applies its own item_processor, so its rows are passed through untouched
+                for nested_response in response:
+                    yield nested_response
+            elif response is not None:
+                yield response
 
 
 def reverse_enumerate(iterable):
@@ -102,8 +78,14 @@ def reverse_enumerate(iterable):
     iteration.  The enumerate object yields pairs containing a count and a value yielded by the iterable argument.
     reverse_enumerate is useful for obtaining an indexed list in reverse order:
         (len(seq) - 1, seq[-1]), (len(seq) - 2, seq[-2]), (len(seq) - 3, seq[-3]), ...
+
+    Iterables which can not be sized or reversed (e.g. generators) are materialized into a tuple first.
     """
-    return zip(range(len(iterable)-1, -1, -1), reversed(iterable))
+    try:
+        return zip(range(len(iterable)-1, -1, -1), reversed(iterable))
+    except TypeError:
+        items = tuple(iterable)
+        return zip(range(len(items)-1, -1, -1), reversed(items))
 
 
 def iiterex(iterable, callback=None, **kwargs):
@@ -116,21 +98,21 @@ def iiterex(iterable, callback=None, **kwargs):
     :param kwargs: kwargs
     :return: iterable
     """
-    for obj in iterable:
-        do_yield = True
-        if callback:
-            if not callback(obj):
-                continue
+    # Resolve the declared attribute callbacks once up front rather than scanning every member of every object.
+    # Sorted by attribute name to keep the order in which the callbacks were historically invoked.
+    declared_callbacks = sorted(
+        (key[:-len(_CALLBACK_SUFFIX)], func) for key, func in kwargs.items() if key.endswith(_CALLBACK_SUFFIX)
+    )
 
-        declared_callbacks = [
-            (kwargs["_".join([attr[0], 'callback'])], getattr(obj, attr[0]))
-            for attr in getmembers(obj) if "_".join([attr[0], 'callback']) in kwargs
-        ]
+    for obj in iterable:
+        if callback and not callback(obj):
+            continue
 
-        for func, o in declared_callbacks:
-            if not func(o):
+        do_yield = True
+        for attr_name, func in declared_callbacks:
+            value = getattr(obj, attr_name, _MISSING)
+            if value is not _MISSING and not func(value):
                 do_yield = False
-                continue
 
         if do_yield:
             yield obj
@@ -143,33 +125,16 @@ def ibatch(iterable, chunk_size=1):
     :param chunk_size: Number of items to chunk before yielding individuals.
     :return: iterable
     """
-    chunk_count = 0
-    while 1:
-        start = chunk_size * chunk_count
+    # The iterable is sliced rather than iterated so that sliceable lazy collections (e.g. query sets) are only
+    # evaluated a chunk at a time.
+    start = 0
+    while True:
         data = iterable[start:start + chunk_size]
-        try:
-            for i in range(chunk_size):
-                yield data[i]
-        except IndexError:
+        for item in data:
+            yield item
+        if len(data) < chunk_size:
             return
-        chunk_count += 1
-        #     do_yield = True
-        #     obj = data[i]
-        #     if callback:
-        #         if not callback(obj):
-        #             continue
-        #
-        #     declared_callbacks = [
-        #         (kwargs["_".join([attr[0], 'callback'])], getattr(obj, attr[0]))
-        #         for attr in getmembers(obj) if "_".join([attr[0], 'callback']) in kwargs]
-        #
-        #     for func, o in declared_callbacks:
-        #         if not func(o):
-        #             do_yield = False
-        #             continue
-        #
-        #     if do_yield:
-        #         yield obj
+        start += chunk_size
 
 
 def first_non_none(*arg):
@@ -197,14 +162,14 @@ def index_of(iterable, predicate, first_only=True):
     :return: The indices of elements within `iterable` which `predicate` matches.
     :rtype: int or [int]
     """
-    matches = [] if not first_only else None
-    for idx, element in enumerate(iterable):
-        if predicate(element):
-            if first_only:
-                return idx
-            else:
-                matches.append(idx)
-
+    matches = (idx for idx, element in enumerate(iterable) if predicate(element))
+    if first_only:
+        first_match = next(matches, None)
+        if first_match is None:
+            raise ValueError()
+        return first_match
+
+    matches = list(matches)
     if not matches:
         raise ValueError()
     return matches
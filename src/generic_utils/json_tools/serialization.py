@@ -13,6 +13,9 @@ from generic_utils.datetimetools import utc
 OBJ_TYPE_KEY = "__type__"
 OBJ_VALUE_KEY = "__value__"
 
+#: Cache of types resolved from the OBJ_TYPE_KEY of serialized objects, keyed by their fully qualified name
+_types_by_fqn = {}
+
 
 class JSONEncoder(json.JSONEncoder):
     """JSON Encoder which encodes objects in a way that, while not representable as accurate JSON objects, can be
@@ -39,7 +42,6 @@ class JSONEncoder(json.JSONEncoder):
         except TypeError:
             if hasattr(obj, "__getstate__"):
                 obj_value = obj.__getstate__()
-                print("Object-value = %r" % obj_value)
             else:
                 obj_value = obj.__dict__
             return {
@@ -80,7 +82,7 @@ def get_object_hook(override_hook=None):
         if override_hook:
             obj = override_hook(obj)
         if OBJ_TYPE_KEY in obj:
-            clazz = get_class_from_fqn(obj[OBJ_TYPE_KEY])
+            clazz = _get_type(obj[OBJ_TYPE_KEY])
             """:type:type"""
             if issubclass(clazz, datetime.datetime):
                 return datetime.datetime.strptime(obj[OBJ_VALUE_KEY], r"%Y-%m-%dT%H:%M:%S.%f+0000").replace(tzinfo=utc)
@@ -95,3 +97,16 @@ def get_object_hook(override_hook=None):
 
         return obj
     return _object_hook
+
+
+def _get_type(class_fqn):
+    """Returns the type for `class_fqn`, only importing it the first time a given fully qualified name is seen
+    :param class_fqn: A fully qualified class name as generated by JSONEncoder
+    :type class_fqn: str
+    :rtype: type
+    """
+    try:
+        return _types_by_fqn[class_fqn]
+    except KeyError:
+        clazz = _types_by_fqn[class_fqn] = get_class_from_fqn(class_fqn)
+        return clazz
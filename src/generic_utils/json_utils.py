@@ -6,6 +6,9 @@ from __future__ import absolute_import
 
 # stdlib
 import collections
+import itertools
+
+_MISSING = object()
 
 
 def query_json_struct_from_path(json_struct, path):
@@ -32,15 +35,17 @@ def path_query(json_struct, path_elts, default_val=None):
     :param default_val: The value to return in=f there is no value at the given path
     :return:
     """
-    if not json_struct or not isinstance(json_struct, collections.Mapping):
-        return default_val
-    elif not path_elts:
+    if not path_elts:
         return default_val
-    elif len(path_elts) == 1:
-        return json_struct.get(path_elts[0], default_val)
-    else:  # len(path_elts) > 1
-        next_step = json_struct.get(path_elts[0], None)
-        return path_query(next_step, path_elts[1:])
+
+    current = json_struct
+    for path_elt in path_elts:
+        if not current or not isinstance(current, collections.Mapping):
+            return default_val
+        current = current.get(path_elt, _MISSING)
+        if current is _MISSING:
+            return default_val
+    return current
 
 
 def increment_json_value_from_path(json_struct, path, value):
@@ -148,9 +153,9 @@ def update_json_struct_add(json_struct, path_elts, value):
         if len(path_elts) == 1:
             # if both the value to be updated, and the new value are lists, the extend the existing list.
             if key in updated and isinstance(value, list) and isinstance(updated[key], list):
-                updated[key].extend(value)
-                # Need to remove duplicates
-                updated[key] = list(set(updated[key]))
+                # Build the merged, de-duplicated list in a single pass without extending the caller's list in place,
+                # keeping the original order of the elements
+                updated[key] = list(collections.OrderedDict.fromkeys(itertools.chain(updated[key], value)))
             else:
                 updated[key] = value
         else:
@@ -72,6 +72,11 @@ class SysLogHandler(python_SysLogHandler):
     DEFAULT_SYSLOG_EXE = "/var/run/syslog"
     TAG_FORMAT_PATTERN = u"{tags}: {msg}"
 
+    #: The tags and delimiter which `_tag_string` was built from, used to detect when it needs to be rebuilt
+    _joined_tags = None
+    _joined_delimiter = None
+    _tag_string = None
+
     def __init__(self,
                  address=('localhost', SYSLOG_UDP_PORT),
                  facility=python_SysLogHandler.LOG_USER,
@@ -100,10 +105,16 @@ class SysLogHandler(python_SysLogHandler):
         :return: formatted message with tags
         """
         unicode_message = self._get_unicode_msg(msg)
-        return SysLogHandler.TAG_FORMAT_PATTERN.format(
-            tags=self.tag_delimiter.join(self.tags),
-            msg=unicode_message
-        ) if self.tags else unicode_message
+        tags = self.tags
+        if not tags:
+            return unicode_message
+
+        # Only re-join the tags when they, or the delimiter, have changed (including in place) since they were joined
+        if tags != self._joined_tags or self.tag_delimiter != self._joined_delimiter:
+            self._joined_tags = list(tags)
+            self._joined_delimiter = self.tag_delimiter
+            self._tag_string = self.tag_delimiter.join(tags)
+        return SysLogHandler.TAG_FORMAT_PATTERN.format(tags=self._tag_string, msg=unicode_message)
 
     @staticmethod
     def _get_unicode_msg(message):
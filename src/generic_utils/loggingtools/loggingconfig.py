@@ -132,7 +132,8 @@ class LogLevelProvider(object):
         """
         override = self._get_override(self.get_overrides(), logger_name)
         if override:
-            return override.level
+            # _get_override has already checked the expiration, so skip the second check that `level` would do
+            return override._level  # pylint: disable=protected-access
         if only_overriden:
             return logging.NOTSET
         logger = logging.getLogger(logger_name)
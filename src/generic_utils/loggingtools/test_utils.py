@@ -12,6 +12,23 @@ from generic_utils.contextlib_ex import ExplicitContextDecorator
 from generic_utils.typetools import as_iterable
 
 
+#: Matches a message pattern which is just literal text anchored on both ends, e.g. "^Test$"
+_ANCHORED_LITERAL_RE = re.compile(r"\^([^\\.^$*+?{}\[\]|()]*)\$\Z")
+
+
+def _get_message_matcher(message_pattern):
+    """Returns a callable which takes a log message and returns whether it matches the regular expression
+    `message_pattern`.  Patterns which are just anchored literal text are compared directly rather than going through
+    the regular expression engine.
+    """
+    literal_match = _ANCHORED_LITERAL_RE.match(message_pattern)
+    if literal_match:
+        literal = literal_match.group(1)
+        # `$` also matches right before a trailing newline
+        return frozenset((literal, literal + "\n")).__contains__
+    return re.compile(message_pattern).match
+
+
 class LogBufferHandler(object):
     """Log handler which stores LogRecords in a local buffer and also allows for definition of the types of log records
     to allow
@@ -160,14 +177,14 @@ class LoggingSpy(ExplicitContextDecorator):
             `expected_count` (True) or if there can be more (False).  Default is `False`
         :type expect_exact_count: bool
         """
-        message_re = re.compile(message_pattern)
+        message_matches = _get_message_matcher(message_pattern)
         count = 0
         for log_record in self.log_records:
             if level is not logging.NOTSET and log_record.levelno != level:
                 continue
             if logger is not None and log_record.name != logger:
                 continue
-            if not message_re.match(log_record.getMessage()):
+            if not message_matches(log_record.getMessage()):
                 continue
             count += 1
 
@@ -2,6 +2,9 @@
 Introduces a 'comparable' mixin which can be used to quickly add support for Py2/3 compatible object comparison
 """
 # pylint: disable=missing-docstring
+# stdlib
+import operator
+
 COMPARABLE_INSTANCE_COMP_KEY_ATTR = '_cmpkey'
 
 
@@ -9,6 +12,8 @@ class ComparableMixin(object):
     """Mostly pulled from http://python3porting.com/preparing.html#comparatively-tricky
 
     """
+    # Declared empty so that subclasses which define __slots__ do not also get an instance __dict__
+    __slots__ = ()
 
     def _cmpkey(self):
         """
@@ -27,19 +32,19 @@ class ComparableMixin(object):
             return NotImplemented
 
     def __lt__(self, other):
-        return self._compare(other, lambda _self, other: _self < other)
+        return self._compare(other, operator.lt)
 
     def __le__(self, other):
-        return self._compare(other, lambda _self, other: _self <= other)
+        return self._compare(other, operator.le)
 
     def __eq__(self, other):
-        return self._compare(other, lambda _self, other: _self == other)
+        return self._compare(other, operator.eq)
 
     def __ge__(self, other):
-        return self._compare(other, lambda _self, other: _self >= other)
+        return self._compare(other, operator.ge)
 
     def __gt__(self, other):
-        return self._compare(other, lambda _self, other: _self > other)
+        return self._compare(other, operator.gt)
 
     def __ne__(self, other):
-        return self._compare(other, lambda _self, other: _self != other)
+        return self._compare(other, operator.ne)
@@ -3,11 +3,11 @@ from __future__ import division
 
 # future/compat
 from builtins import map
-from builtins import range
-from past.utils import old_div
 
 # stdlib
-import collections
+import struct
+
+from generic_utils.typetools import is_iterable
 
 
 def split_by_size(s, size, return_remainder=False):
@@ -18,21 +18,27 @@ def split_by_size(s, size, return_remainder=False):
     :param return_remainder: True|False for whether or not to return the remainder string (could be '')
     :return: split tuple
     """
-    if not isinstance(size, collections.Iterable):
-        # if size is 2, [2, 4, 6, 8, 10...]
-        non_iter_size = size
-        size = [non_iter_size for i in range(old_div(len(s),non_iter_size))]
-
-    retval = ()
+    if not is_iterable(size, exclude_string=False):
+        count = len(s) // size
+        if type(s) is bytes and size > 0:
+            # Fixed width fields of a byte string are all split by a single struct unpack
+            parts = struct.unpack_from("%ds" % size * count, s)
+            return parts + (s[size * count:],) if return_remainder else parts
+        # if size is 2, [2, 2, 2, ...] for as many whole chunks of 2 as there are in `s`
+        size = [size] * count
+
+    # Slice at a running offset rather than re-slicing the remainder of `s` for each part, which copies the remainder
+    # every time.
+    parts = []
+    offset = 0
     for i in size:
-        t = s[:i]
-        s = s[i:]
-        retval = retval + (t,)
+        parts.append(s[offset:offset + i])
+        offset += i
 
     if return_remainder:
-        retval = retval + (s,)
+        parts.append(s[offset:])
 
-    return retval
+    return tuple(parts)
 
 
 def versiontuple(version_string):
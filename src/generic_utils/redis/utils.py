@@ -2,27 +2,34 @@
 Utilities for redis
 """
 # future/compat
-from builtins import str
+from six.moves import intern
 
 from redis.client import StrictRedis
 
 from generic_utils.config import get_config_value
+from generic_utils.config import get_config_values_by_prefix
 
 DEFAULT_URL_PATTERN = "redis://{user_info}{host}:{port}/{db}"
 USER_PATTERN = "{username}{password}@"
 
-CONFIG_REDIS_SUFFIX = "_REDIS_"
-CONFIG_HOST_SUFFIX = CONFIG_REDIS_SUFFIX + "HOST"
-CONFIG_PORT_SUFFIX = CONFIG_REDIS_SUFFIX + "PORT"
-CONFIG_DB_SUFFIX = CONFIG_REDIS_SUFFIX + "DB"
-CONFIG_PASSWORD_SUFFIX = CONFIG_REDIS_SUFFIX + "PASSWORD"
-CONFIG_PREFIX_SUFFIX = CONFIG_REDIS_SUFFIX + "PREFIX"
-CONFIG_TIMEOUT_SUFFIX = CONFIG_REDIS_SUFFIX + "TIMEOUT"
+#: Positional form of `DEFAULT_URL_PATTERN` used by `_format_url` so that building a url does not need to go through
+#: keyword based `str.format` handling
+_URL_TEMPLATE = "redis://%s%s:%s/%s"
+
+CONFIG_REDIS_SUFFIX = intern("_REDIS_")
+CONFIG_HOST_SUFFIX = intern(CONFIG_REDIS_SUFFIX + "HOST")
+CONFIG_PORT_SUFFIX = intern(CONFIG_REDIS_SUFFIX + "PORT")
+CONFIG_DB_SUFFIX = intern(CONFIG_REDIS_SUFFIX + "DB")
+CONFIG_PASSWORD_SUFFIX = intern(CONFIG_REDIS_SUFFIX + "PASSWORD")
+CONFIG_PREFIX_SUFFIX = intern(CONFIG_REDIS_SUFFIX + "PREFIX")
+CONFIG_TIMEOUT_SUFFIX = intern(CONFIG_REDIS_SUFFIX + "TIMEOUT")
 
 
 class RedisConfigComponents(object):
     """ Configuration object for RabbitMQ.
     """
+    __slots__ = ("host", "port", "db", "password", "timeout", "prefix")
+
     def __init__(self, host, port, db, password, timeout, prefix):
         self.host = host
         self.port = port
@@ -55,15 +62,14 @@ def get_client_url(redis_client, include_userinfo=False, include_password=False)
                                 password in the returned URL
     :return: A redis url for the provided `redis_client`
     """
-    connection_kwargs = dict(redis_client.connection_pool.connection_kwargs)
+    connection_kwargs = redis_client.connection_pool.connection_kwargs
     user_info = ""
     if include_userinfo and "username" in connection_kwargs:
         password = ":%s" % connection_kwargs.get("password", "") if include_password else ""
         user_info = USER_PATTERN.format(username=connection_kwargs["username"],
                                         password=password)
 
-    connection_kwargs["user_info"] = user_info
-    return DEFAULT_URL_PATTERN.format(**connection_kwargs)
+    return _format_url(user_info, connection_kwargs["host"], connection_kwargs["port"], connection_kwargs["db"])
 
 
 def get_connection_url(host="localhost", port=6379, db=0, password=None):
@@ -73,10 +79,14 @@ def get_connection_url(host="localhost", port=6379, db=0, password=None):
         user_info = USER_PATTERN.format(username="nouser",
                                         password=password)
 
-    return DEFAULT_URL_PATTERN.format(user_info=user_info,
-                                      host=host,
-                                      port=port,
-                                      db=db)
+    return _format_url(user_info, host, port, db)
+
+
+def _format_url(user_info, host, port, db):
+    """Returns a redis url built from the provided components.  This is equivalent to formatting `DEFAULT_URL_PATTERN`
+    but is specialized to the fixed set of components a redis url is made up of.
+    """
+    return _URL_TEMPLATE % (user_info, host, port, db)
 
 
 def get_connection_url_from_config_value(prefix,
@@ -129,12 +139,13 @@ def get_redis_config_values(prefix,
     :return: A namedtuple RedisConfigComponents which contains all of the values of the requested Redis configuration
     :rtype: RedisConfigComponents
     """
-    host = get_config_value(prefix + CONFIG_HOST_SUFFIX, default_host)
-    port = get_config_value(prefix + CONFIG_PORT_SUFFIX, default_port)
-    db = get_config_value(prefix + CONFIG_DB_SUFFIX, default_db)
-    password = get_config_value(prefix + CONFIG_PASSWORD_SUFFIX, default_password, secure=True)
-    timeout = get_config_value(prefix + CONFIG_TIMEOUT_SUFFIX, default_timeout, val_type=int)
-    prefix_val = get_config_value(prefix + CONFIG_PREFIX_SUFFIX, default_prefix)
+    source = get_config_values_by_prefix(prefix + CONFIG_REDIS_SUFFIX)
+    host = get_config_value(prefix + CONFIG_HOST_SUFFIX, default_host, source=source)
+    port = get_config_value(prefix + CONFIG_PORT_SUFFIX, default_port, source=source)
+    db = get_config_value(prefix + CONFIG_DB_SUFFIX, default_db, source=source)
+    password = get_config_value(prefix + CONFIG_PASSWORD_SUFFIX, default_password, secure=True, source=source)
+    timeout = get_config_value(prefix + CONFIG_TIMEOUT_SUFFIX, default_timeout, val_type=int, source=source)
+    prefix_val = get_config_value(prefix + CONFIG_PREFIX_SUFFIX, default_prefix, source=source)
 
     return RedisConfigComponents(host, port, db, password, timeout, prefix_val)
 
@@ -162,7 +173,6 @@ class RedisBackedServiceMixin(object):
         self.key_prefix = key_prefix
 
     def _get_full_redis_key(self, key):
-        key = str(key)
         if self.key_prefix:
             key = self.key_prefix + self.redis_key_separator + key
 
@@ -8,7 +8,7 @@ class SSLAdapter(HTTPAdapter):
     Useful because OpenSSL bugs can create situations where Python urllib2 requests can't complete successful
      handshakes.
     """
-    __attrs__ = HTTPAdapter.__attrs__ + ['ssl_version']
+    __attrs__ = tuple(HTTPAdapter.__attrs__) + ('ssl_version',)
 
     def __init__(self, ssl_version=None, **kwargs):
         """Set SSL version on init.
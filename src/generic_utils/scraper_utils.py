@@ -1,18 +1,14 @@
 """Module for common web-scraping helper functions / class
+
+The html dependencies (requests, bs4 and lxml) are imported within the methods which use them so that importing this
+module does not pay for loading all of them up front.
 """
 # future/compat
 from builtins import object
 from past.builtins import basestring
 
-import requests
-from bs4 import UnicodeDammit
-from lxml import html
-from lxml.html.clean import Cleaner
-
 from generic_utils import loggingtools
 
-from .requests_utils import SSLAdapter
-
 log = loggingtools.getLogger()
 
 
@@ -27,6 +23,8 @@ class ScraperHelper(object):
         :returns:
         :rtype: unicode
         """
+        from bs4 import UnicodeDammit
+
         converted = UnicodeDammit(html_string, is_html=True)
         if not converted.unicode_markup:
             raise UnicodeDecodeError(
@@ -48,6 +46,9 @@ class ScraperHelper(object):
         :return: the URL response
         :rtype: requests.Response
         """
+        import requests
+        from .requests_utils import SSLAdapter
+
         tls_session = requests.Session()
         if ssl_protocol is not None:
             tls_adapter = SSLAdapter(ssl_protocol)
@@ -65,6 +66,9 @@ class ScraperHelper(object):
         :return: cleaned html
         :rtype: str
         """
+        from lxml import html
+        from lxml.html.clean import Cleaner
+
         if safe_attrs is None:
             safe_attrs = set(html.defs.safe_attrs)
             safe_attrs.add('content')
@@ -91,6 +95,8 @@ class ScraperHelper(object):
         :return: parsed html document, optionally sanitized and relative URLs transformed
         :rtype: lxml.html.HtmlElement
         """
+        from lxml import html
+
         if sanitize:
             raw_html = cls.sanitize_html_text(raw_html)
 
@@ -8,7 +8,6 @@ from __future__ import absolute_import
 
 # stdlib
 import socket
-from collections import defaultdict
 from time import time
 
 from generic_utils import loggingtools
@@ -118,14 +117,14 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
     def __init__(self, *args, **kw):
         super(CacheStatsClient, self).__init__(*args, **kw)
-        self.cache = defaultdict(list)
+        self.cache = {}
         self.timings = []
 
     def reset(self):
-        """Reset the caches
+        """Reset the caches in place
         """
-        self.cache = defaultdict(list)
-        self.timings = []
+        self.cache.clear()
+        del self.timings[:]
 
     def timing(self, stat, delta, rate=1):
         """Send new timing information. `delta` is in milliseconds."""
@@ -133,15 +132,25 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
         now = time() * 1000
         self.timings.append([stat, now - delta, delta, now])
 
+    def timing_batch(self, entries):
+        """Send timing information for multiple stats which all completed at the same time.
+
+        :param entries: An iterable of `(stat, delta)` tuples where `delta` is in milliseconds.
+        """
+        now = time() * 1000
+        append = self.timings.append
+        for stat, delta in entries:
+            append(['%s|timing' % stat, now - delta, delta, now])
+
     def incr(self, stat, count=1, rate=1):
         """Increment a stat by `count`."""
         stat = '%s|count' % stat
-        self.cache[stat].append([count, rate])
+        self.cache.setdefault(stat, []).append([count, rate])
 
     def decr(self, stat, count=1, rate=1):
         """Decrement a stat by `count`."""
         stat = '%s|count' % stat
-        self.cache[stat].append([-count, rate])
+        self.cache.setdefault(stat, []).append([-count, rate])
 
     def gauge(self, stat, value, rate=1, delta=False):
         """Set a gauge value."""
@@ -150,7 +159,7 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
     def set(self, stat, value, rate=1):
         stat = '%s|set' % stat
-        self.cache[stat].append([value, rate])
+        self.cache.setdefault(stat, []).append([value, rate])
 
 
 class TestCaseStatsClient(CacheStatsClient):
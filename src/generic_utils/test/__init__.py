@@ -10,26 +10,44 @@ import threading
 import types
 import unittest
 
-from nose.plugins import attrib
 from nose.tools import nottest
 
 from generic_utils import five
 from generic_utils import loggingtools
-
-try:
-    from ddt import ddt, mk_test_name, add_test, data as ddt_data, UNPACK_ATTR, DATA_ATTR, FILE_ATTR, process_file_data
-except ImportError:
-    # pylint: disable=invalid-name
-    ddt = None
-    ddt_data = None
-    DATA_ATTR = None
-
-    def ddt_data(*_):
-        """
-        Dummy ddt data decorator
-        """
-        raise RuntimeError("In order to use the data decorator you must install python-utils with the "
-                           "'test_utils' extras package; eg python-utils['test_utils']")
+from generic_utils.test.nose_utils import get_attr_decorator
+
+# ddt is imported on first use by `_load_ddt` so that importing this module does not pay for it unless data driven
+# tests are actually being used
+# pylint: disable=invalid-name
+ddt = None
+mk_test_name = None
+add_test = None
+ddt_data = None
+process_file_data = None
+UNPACK_ATTR = None
+DATA_ATTR = None
+FILE_ATTR = None
+_ddt_load_attempted = False
+# pylint: enable=invalid-name
+
+
+def _load_ddt():
+    """Imports the ddt dependency into this module the first time this is called.
+
+    :return: Whether or not ddt is available
+    :rtype: bool
+    """
+    # pylint: disable=global-statement,invalid-name,redefined-outer-name
+    global ddt, mk_test_name, add_test, ddt_data, process_file_data, UNPACK_ATTR, DATA_ATTR, FILE_ATTR
+    global _ddt_load_attempted
+    if not _ddt_load_attempted:
+        _ddt_load_attempted = True
+        try:
+            from ddt import ddt, mk_test_name, add_test, data as ddt_data, UNPACK_ATTR, DATA_ATTR, FILE_ATTR, \
+                process_file_data
+        except ImportError:
+            pass
+    return ddt is not None
 
 
 JIRA_ATTR_NAME = "jira"
@@ -39,7 +57,15 @@ LOG = loggingtools.getLogger()
 
 __all__ = ["jira", "TestCase", "test_generator", "data", "bad_data"]
 
-data = ddt_data  # pylint: disable=invalid-name
+
+def data(*values):
+    """ddt data decorator which generates a test from the decorated test method for each of the provided `values`.  See
+    ddt's `data` decorator for more details.
+    """
+    if not _load_ddt():
+        raise RuntimeError("In order to use the data decorator you must install python-utils with the "
+                           "'test_utils' extras package; eg python-utils['test_utils']")
+    return ddt_data(*values)
 
 
 def jira(*args, **kwargs):
@@ -77,30 +103,155 @@ def jira(*args, **kwargs):
     def my_test():
         pass
     """
+    resolved = kwargs.pop('resolved', True)
+    skip_val = kwargs.pop('skip', False)
+    attr_wrapped = get_attr_decorator(JIRA_ATTR_NAME, args)
+
     def wrap(func):
         """Function wrapper
         """
-        resolved = kwargs.pop('resolved', True)
-        skip_val = kwargs.pop('skip', False)
-        attrs = {
-            JIRA_ATTR_NAME: args
-        }
-
         if not resolved:
             if skip_val:
                 func = unittest.skip("Jira(s) %s are not resolved yet" % str(args))(func)
             else:
                 func = unittest.expectedFailure(func)
 
-        attr_wrapped = attrib.attr(**attrs)
         return attr_wrapped(func)
 
     return wrap
 
+#: Whether or not the warning about ddt not being available has been logged, so that it is only logged once rather
+#: than for every TestCase class
+_ddt_unavailable_warned = False  # pylint: disable=invalid-name
+
 _TEST_GENERATOR_PARAMS_ATTR = "_TEST_GENERATOR_PARAMS_ATTR"
 _BAD_DATA_ATTR = "_BAD_DATA_ATTR"
 
 
+def _add_single_value_test(cls, test_name, func, value):
+    """Adds a test named `test_name` to `cls` which calls the test `func` with the single data `value`.  This produces
+    the same test as ddt's `add_test` for a single value without going through its generic argument handling.
+    """
+    def single_value_test(self):
+        """Generated data driven test
+        """
+        return func(self, value)
+
+    single_value_test.__dict__.update(func.__dict__)
+    single_value_test.__name__ = test_name
+    single_value_test.__module__ = func.__module__
+    single_value_test.__wrapped__ = func
+    single_value_test.__doc__ = func.__doc__
+    if func.__doc__:
+        try:
+            single_value_test.__doc__ = func.__doc__.format(value)
+        except (IndexError, KeyError):
+            # The docstring just happens to contain formatting characters
+            pass
+    setattr(cls, test_name, single_value_test)
+
+
+#: Attribute set on the setUp/tearDown wrappers created by `TestCaseMixinMetaClass` which refers to the wrapped method
+_WRAPPED_METHOD_ATTR = "_wrapped_core_test_method"
+
+#: Attribute set on the setUp/tearDown wrappers created by `TestCaseMixinMetaClass` which indicates whether or not the
+#: wrapper calls the _custom_setup/_custom_teardown hook
+_CALLS_HOOK_ATTR = "_calls_custom_hook"
+
+#: The default no-op _custom_setup/_custom_teardown hooks of `TestCase`.  These are tracked here rather than marked with
+#: a function attribute so that they are not mistaken for decorated tests by `_expand_generators`
+_default_hooks = set()  # pylint: disable=invalid-name
+
+
+def _default_hook(func):
+    """Decorator which marks `func` as a default no-op _custom_setup/_custom_teardown hook which the setUp/tearDown
+    wrappers do not need to call
+    """
+    _default_hooks.add(func)
+    return func
+
+
+def _has_custom_hook(cls, hook_name):
+    """Returns whether or not `cls` has a _custom_setup/_custom_teardown hook named `hook_name` which does something
+    """
+    hook = getattr(cls, hook_name, None)
+    return hook is not None and six.get_unbound_function(hook) not in _default_hooks
+
+
+def _is_outermost_wrapper(test_case, method_name, wrapper):
+    """Returns whether or not `wrapper` is the setUp/tearDown that is resolved for `test_case`, as opposed to one that is
+    being reached through a super() call from the setUp/tearDown of a subclass which already does the wrapper's work
+    """
+    return six.get_unbound_function(getattr(type(test_case), method_name)) is wrapper
+
+
+def _is_override_enabled(test_case):
+    """Returns whether or not the setUp/tearDown wrappers should do their work for `test_case`.  This is resolved when
+    the wrappers are called rather than when the class is created so that `_enable_test_method_override` can depend on
+    state which is changed after the class is defined, such as `RedisTestCaseMixin.redis_mixin_enabled`
+    """
+    enable_override = getattr(test_case, "_enable_test_method_override", None)
+    return enable_override is None or enable_override()
+
+
+def _wrap_setup(setup, call_hook):
+    """Returns a wrapper for the TestCase `setup` method which records the current test and, if `call_hook` is True,
+    calls _custom_setup before calling `setup`
+    """
+    if call_hook:
+        def setUp(self):  # pylint: disable=invalid-name
+            """Wrapper which wraps the core setUp and calls the _custom_setup
+            """
+            if _is_outermost_wrapper(self, "setUp", setUp) and _is_override_enabled(self):
+                TestCaseMixinMetaClass._thread_locals.current_test = self
+                try:
+                    self._custom_setup()
+                except AttributeError:
+                    pass
+            setup(self)
+    else:
+        def setUp(self):  # pylint: disable=invalid-name,function-redefined
+            """Wrapper which wraps the core setUp
+            """
+            if _is_outermost_wrapper(self, "setUp", setUp) and _is_override_enabled(self):
+                TestCaseMixinMetaClass._thread_locals.current_test = self
+            setup(self)
+
+    setattr(setUp, _WRAPPED_METHOD_ATTR, setup)
+    setattr(setUp, _CALLS_HOOK_ATTR, call_hook)
+    return setUp
+
+
+def _wrap_teardown(teardown, call_hook):
+    """Returns a wrapper for the TestCase `teardown` method which, if `call_hook` is True, calls _custom_teardown before
+    calling `teardown` and then clears the current test
+    """
+    if call_hook:
+        def tearDown(self):  # pylint: disable=invalid-name
+            """Wrapper which wraps the core tearDown and calls the _custom_teardown
+            """
+            if not (_is_outermost_wrapper(self, "tearDown", tearDown) and _is_override_enabled(self)):
+                teardown(self)
+                return
+            try:
+                self._custom_teardown()
+            except AttributeError:
+                pass
+            teardown(self)
+            del TestCaseMixinMetaClass._thread_locals.current_test
+    else:
+        def tearDown(self):  # pylint: disable=invalid-name,function-redefined
+            """Wrapper which wraps the core tearDown
+            """
+            teardown(self)
+            if _is_outermost_wrapper(self, "tearDown", tearDown) and _is_override_enabled(self):
+                del TestCaseMixinMetaClass._thread_locals.current_test
+
+    setattr(tearDown, _WRAPPED_METHOD_ATTR, teardown)
+    setattr(tearDown, _CALLS_HOOK_ATTR, call_hook)
+    return tearDown
+
+
 class TestCaseMixinMetaClass(type):
     """Meta class for the base TestCase which provides core hooks and test case modifications which are beneficial
     for all test cases.
@@ -112,7 +263,6 @@ class TestCaseMixinMetaClass(type):
         guarantees about setup and teardown lifecycle.
     """
 
-    _core_test_methods_overridden = False
     _thread_locals = threading.local()
 
     def __init__(cls, name, bases, dct):
@@ -120,84 +270,84 @@ class TestCaseMixinMetaClass(type):
 
         super(TestCaseMixinMetaClass, cls).__init__(name, bases, dct)
 
-    def __call__(cls, *args, **kwargs):
-        if not getattr(cls, "_core_test_methods_overridden", False) and \
-                (not hasattr(cls, "_enable_test_method_override") or cls._enable_test_method_override()):
-            current_setup = cls.setUp
-            current_teardown = cls.tearDown
+        cls._wrap_core_test_methods(dct)
 
-            def cb_wrapped_setUp(self, *args, **kwargs):  # pylint: disable=invalid-name
-                """Wrapper which wraps the core setUp and calls the _custom_setup
-                """
-                cls._thread_locals.__setattr__("current_test", self)
-                try:
-                    self._custom_setup()
-                except AttributeError:
-                    pass
-                current_setup(self)
-
-            def cb_wrapped_tearDown(self):  # pylint: disable=invalid-name
-                """Wrapper which wraps the core tearDown and calls the _custom_teardown
-                """
-                try:
-                    self._custom_teardown()
-                except AttributeError:
-                    pass
-                current_teardown(self)
-                cls._thread_locals.__delattr__("current_test")
-
-            # pylint: disable=attribute-defined-outside-init, invalid-name
-            if six.PY2:
-                import new
-                cls.setUp = new.instancemethod(cb_wrapped_setUp, None, cls)
-                cls.tearDown = new.instancemethod(cb_wrapped_tearDown, None, cls)
-            else:
-                cls.setUp = cb_wrapped_setUp
-                cls.tearDown = cb_wrapped_tearDown
-
-            cls._core_test_methods_overridden = True
+    def _wrap_core_test_methods(cls, dct):
+        """Wraps the core setUp and tearDown methods of the class so that they call _custom_setup and _custom_teardown.
+        This is done once when the class is created and only when the class defines its own setUp/tearDown or the
+        inherited ones are not already wrapped appropriately for this class.  Whether or not the class has hooks that
+        actually need to be called is resolved here as well so that the wrappers do not pay for calling the default
+        no-op hooks.  Whether or not the wrappers are enabled at all is left to `_is_override_enabled` when they are
+        called.
+        """
+        for method_name, wrap_method, hook_name in (("setUp", _wrap_setup, "_custom_setup"),
+                                                    ("tearDown", _wrap_teardown, "_custom_teardown")):
+            current_method = getattr(cls, method_name, None)
+            if current_method is None:
+                continue
+            wrapped_method = None
+            if method_name not in dct:
+                wrapped_method = getattr(current_method, _WRAPPED_METHOD_ATTR, None)
 
-        return super(TestCaseMixinMetaClass, cls).__call__(*args, **kwargs)
+            call_hook = _has_custom_hook(cls, hook_name)
+            if wrapped_method is None:
+                setattr(cls, method_name, wrap_method(current_method, call_hook))
+            elif getattr(current_method, _CALLS_HOOK_ATTR) != call_hook:
+                setattr(cls, method_name, wrap_method(wrapped_method, call_hook))
 
     def _expand_generators(cls):
         """Discovers all test generator attributes on tests within this test case and expands them out as test
         generators
         """
-        if ddt is None:
-            LOG.warn("Python-utils test dependency 'ddt' is not available in the python path which means that "
-                     "data driven test capabilities as well as test generator capabilities on TestCase's will "
-                     "not be available.  When using the python-utils TestCase it is recommended to add the "
-                     "dependency \"python-utils['test_utils']\" to your projects dependencies.")
+        # All of the generator decorators set plain function attributes, so only functions which have attributes need
+        # to be looked at.  This is gathered up front as the class is modified while expanding the generators.
+        decorated_funcs = [(name, func) for name, func in cls.__dict__.items()
+                           if isinstance(func, types.FunctionType) and func.__dict__]
+        if not decorated_funcs:
             return
 
-        for name, func in list(cls.__dict__.items()):
-            if not isinstance(func, types.FunctionType):
-                continue
+        if not _load_ddt():
+            global _ddt_unavailable_warned  # pylint: disable=global-statement,invalid-name
+            if not _ddt_unavailable_warned:
+                LOG.warn("Python-utils test dependency 'ddt' is not available in the python path which means that "
+                         "data driven test capabilities as well as test generator capabilities on TestCase's will "
+                         "not be available.  When using the python-utils TestCase it is recommended to add the "
+                         "dependency \"python-utils['test_utils']\" to your projects dependencies.")
+                _ddt_unavailable_warned = True
+            return
+
+        for name, func in decorated_funcs:
+            # Read the generator attributes straight from the function dict in one pass rather than going through
+            # hasattr/getattr for each one
+            func_attrs = func.__dict__
+            generator_params = func_attrs.get(_TEST_GENERATOR_PARAMS_ATTR)
+            bd_arg_list = func_attrs.get(_BAD_DATA_ATTR)
+            data_values = func_attrs.get(DATA_ATTR)
+            file_attr = func_attrs.get(FILE_ATTR)
+
             remove_test = False
-            if hasattr(func, _TEST_GENERATOR_PARAMS_ATTR):
-                generator_params = getattr(func, _TEST_GENERATOR_PARAMS_ATTR)
+            if generator_params is not None:
                 cls._expand_test_generator(name, func, generator_params)
                 remove_test = True
-            if hasattr(func, _BAD_DATA_ATTR):
-                bd_arg_list = getattr(func, _BAD_DATA_ATTR)
+            if bd_arg_list is not None:
                 cls._expand_bad_data_tests(name, func, bd_arg_list)
                 remove_test = True
 
             # Process DDT decorators so we do it all in one loop
-            if hasattr(func, DATA_ATTR):
-                for i, value in enumerate(getattr(func, DATA_ATTR)):
+            if data_values is not None:
+                unpack = UNPACK_ATTR in func_attrs
+                for i, value in enumerate(data_values):
                     test_name = mk_test_name(name, getattr(value, "__name__", value), i)
-                    if hasattr(func, UNPACK_ATTR):
-                        if isinstance(value, tuple) or isinstance(value, list):
+                    if unpack:
+                        if isinstance(value, (tuple, list)):
                             add_test(cls, test_name, func, *value)
                         else:
                             # unpack dictionary
                             add_test(cls, test_name, func, **value)
                     else:
-                        add_test(cls, test_name, func, value)
+                        _add_single_value_test(cls, test_name, func, value)
                 remove_test = True
-            if hasattr(func, FILE_ATTR):
-                file_attr = getattr(func, FILE_ATTR)
+            if file_attr is not None:
                 process_file_data(cls, name, func, file_attr)
                 remove_test = True
 
@@ -218,7 +368,7 @@ class TestCaseMixinMetaClass(type):
                 test_name = mk_test_name(name, getattr(val, "__name__", val), idx)
                 idx += 1
                 if unpack:
-                    if isinstance(val, tuple) or isinstance(val, list):
+                    if isinstance(val, (tuple, list)):
                         add_test(cls, test_name, exp_failure_method, *val)
                     else:
                         # unpack dictionary
@@ -252,6 +402,7 @@ class TestCase(with_metaclass(TestCaseMixinMetaClass, unittest.TestCase)):
         See docstring of TestCaseMixinMetaClass for more details.
     """
 
+    @_default_hook
     def _custom_setup(self):  # pylint: disable=invalid-name
         """Setup method that should be overridden by utility TestCase subclasses instead of the core test setUp method.
         This is really no different then the core setUp method except that in general a test writer does not ever
@@ -262,6 +413,7 @@ class TestCase(with_metaclass(TestCaseMixinMetaClass, unittest.TestCase)):
         """
         pass
 
+    @_default_hook
     def _custom_teardown(self):  # pylint: disable=invalid-name
         """TearDown method that should be overridden by utility TestCase subclasses instead of the core test tearDown
         method.  This is really no different then the core setUp method except that in general a test writer does not
@@ -282,10 +434,7 @@ class TestCase(with_metaclass(TestCaseMixinMetaClass, unittest.TestCase)):
             running.
         :rtype: TestCase
         """
-        try:
-            return cls._thread_locals.__getattribute__("current_test")  # pylint: disable=no-member
-        except AttributeError:
-            return None
+        return getattr(cls._thread_locals, "current_test", None)
 
 
 def test_generator(generator_func=None):
@@ -298,13 +447,14 @@ def test_generator(generator_func=None):
         test method.
     :rtype: func
     """
+    generator_params = {
+        "func": generator_func
+    }
+
     def test_decorator(test_func):
         """Internal function decorator method
         """
-        generator_params = {
-            "func": generator_func
-        }
-        setattr(test_func, _TEST_GENERATOR_PARAMS_ATTR, generator_params)
+        test_func.__dict__[_TEST_GENERATOR_PARAMS_ATTR] = generator_params
         return test_func
     return test_decorator
 
@@ -342,8 +492,6 @@ def bad_data(*values, **kwargs):
         """Internal wrapper function for acting as a decorator which sets the bad data attributes onto the target
         function
         """
-        bad_data_list = getattr(func, _BAD_DATA_ATTR, [])
-        bad_data_list.append((values, kwargs))
-        setattr(func, _BAD_DATA_ATTR, bad_data_list)
+        func.__dict__.setdefault(_BAD_DATA_ATTR, []).append((values, kwargs))
         return func
     return wrapper
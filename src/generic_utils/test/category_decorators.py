@@ -21,7 +21,6 @@ attribute.  In order to run all tests but exclude the "slow" tests you could the
 """
 from generic_utils.decorator_tools import decorator
 from generic_utils.test.nose_utils import get_attrib_decorated_func
-from generic_utils.test.nose_utils import specialize_attr_decorator
 
 TEST_CATEGORY_ATTR_NAME = "category"
 
@@ -115,16 +114,31 @@ def test_type(func=None, *category_names):
     return get_attrib_decorated_func(func, TEST_TYPE_ATTR_NAME, values=category_names, allow_multiple_values=False)
 
 
+def _specialized_attr_decorator(attr_name, value, allow_multiple_values=True):
+    """Returns a decorator which applies the single `value` to the `attr_name` attribute of the decorated test and can be
+    used with or without being called (e.g. `@slow_test` or `@slow_test()`).  This applies the attribute directly rather
+    than going through the generic `test_category`/`test_type` decorators.
+    """
+    values = (value,)
+
+    def specialized_decorator(func=None):
+        """Decorator which applies the specialized attribute value to `func`"""
+        if func is None:
+            return specialized_decorator
+        return get_attrib_decorated_func(func, attr_name, values=values, allow_multiple_values=allow_multiple_values)
+    return specialized_decorator
+
+
 # pylint: disable=invalid-name
 
 # Short hand decorators for specific categories
-slow_test = specialize_attr_decorator(test_category, TestCategory.SLOW)
+slow_test = _specialized_attr_decorator(TEST_CATEGORY_ATTR_NAME, TestCategory.SLOW)
 """Test Decorator for the `slow` test category"""
 
-integration_test = specialize_attr_decorator(test_type, TestType.INTEGRATION)
+integration_test = _specialized_attr_decorator(TEST_TYPE_ATTR_NAME, TestType.INTEGRATION, allow_multiple_values=False)
 """Test Decorator for the `integration` test category"""
 
-system_test = specialize_attr_decorator(test_type, TestType.SYSTEM)
+system_test = _specialized_attr_decorator(TEST_TYPE_ATTR_NAME, TestType.SYSTEM, allow_multiple_values=False)
 """Test Decorator for the `system` test category"""
 
 # pylint: enable=invalid-name
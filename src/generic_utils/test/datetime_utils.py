@@ -7,15 +7,23 @@ import datetime
 
 class EST(datetime.tzinfo):
     """A tzinfo for the EASTERN timezone.  This is NOT to be used in production and is purely for testing purposes
-    for environments where pytz doesn't exist and you need a timezone that is not UTC
+    for environments where pytz doesn't exist and you need a timezone that is not UTC.  The `EST_TZ` instance can be
+    used instead of creating new instances.
     """
+    _UTCOFFSET = datetime.timedelta(hours=-5)
+    _DST = datetime.timedelta(0)
+
     def utcoffset(self, dt):  # pylint: disable=unused-argument
         """The utc offset
         """
-        return datetime.timedelta(hours=-5)
+        return self._UTCOFFSET
 
     def dst(self, dt):  # pylint: disable=unused-argument
         """
         dst
         """
-        return datetime.timedelta(0)
+        return self._DST
+
+
+#: Shared instance of the `EST` timezone
+EST_TZ = EST()
@@ -1,7 +1,12 @@
 """Tools for simplifying mocking of objects
 """
+# future/compat
+import six
+
 # stdlib
 import io
+import logging
+import os
 
 from mock import patch
 
@@ -12,16 +17,13 @@ from generic_utils.contextlib_ex import ExplicitContextManagerMixin
 
 LOG = loggingtools.getLogger()
 
-# future/compat
-try:
-    from urllib import request
-    urlopen = request.urlopen
-except ImportError:
-    import urllib2
-    urlopen = urllib2.urlopen
+if six.PY2:
+    from urllib2 import urlopen  # pylint: disable=import-error
+else:
+    from urllib.request import urlopen  # pylint: disable=import-error,no-name-in-module
 
 
-_URLOPEN_PATCH_TARGET = "{0}.urlopen".format(urlopen.__module__)
+_URLOPEN_PATCH_TARGET = urlopen.__module__ + ".urlopen"
 
 
 class SpyObjectResult(object):
@@ -50,8 +52,9 @@ class SpyObject(ExplicitContextManagerMixin, ContextDecorator):
     cb_func = None
     cb_post_func = None
     _patched_object = None
+    _wrapped_method = None
 
-    illegal_kwargs = {"autospec", "side_effect"}
+    illegal_kwargs = frozenset(("autospec", "side_effect"))
 
     def __init__(self, obj, method_name, mock_kwargs=None, cb_func=None, cb_post_func=None):
         """
@@ -78,38 +81,19 @@ class SpyObject(ExplicitContextManagerMixin, ContextDecorator):
         self.cb_func = cb_func
         self.cb_post_func = cb_post_func
         self._patched_object = None
-        for illegal_kwarg in self.illegal_kwargs:
-            if illegal_kwarg in self.mock_kwargs:
+        if self.mock_kwargs:
+            for illegal_kwarg in self.illegal_kwargs.intersection(self.mock_kwargs):
                 LOG.warn("Illegal kwarg %s provided as input to spy_object and it will be ignored", illegal_kwarg)
                 del self.mock_kwargs[illegal_kwarg]
 
     def __enter__(self):
-        wrapped_method = getattr(self.target_obj, self.target_method)
-        if self.cb_func or self.cb_post_func:
-            cb_func = self.cb_func
-            cb_post_func = self.cb_post_func
-
-            def cb_wedge(*args, **kwargs):
-                """Function which wedges a call to the provided cb_func in front of the actual underlying method
-                """
-                if cb_func:
-                    cb_func(*args, **kwargs)
-                result = wrapped_method(*args, **kwargs)
-                if cb_post_func:
-                    new_result = cb_post_func(result, args, kwargs)
-                    if isinstance(new_result, SpyObjectResult):
-                        result = new_result.value
-                return result
-            side_effect = cb_wedge
-        else:
-            side_effect = wrapped_method
-        is_property = isinstance(wrapped_method, property)
-        mock_kwargs = self.mock_kwargs
+        wrapped_method = self._wrapped_method = getattr(self.target_obj, self.target_method)
+        side_effect = self._spy_side_effect if self.cb_func or self.cb_post_func else wrapped_method
 
-        self._patched_object = patch.object(self.target_obj, self.target_method, autospec=True, **mock_kwargs)
+        self._patched_object = patch.object(self.target_obj, self.target_method, autospec=True, **self.mock_kwargs)
 
         mocked_method = self._patched_object.start()
-        if is_property:
+        if isinstance(wrapped_method, property):
             self._safe_debug_log("Spying on property %s of object %r", self.target_method, self.target_obj)
             mocked_method.__get__ = wrapped_method.__get__
             raise NotImplementedError("Property spying is not currently supported.")
@@ -118,11 +102,25 @@ class SpyObject(ExplicitContextManagerMixin, ContextDecorator):
             mocked_method.side_effect = side_effect
         return mocked_method
 
+    def _spy_side_effect(self, *args, **kwargs):
+        """Side effect for the spy which wedges calls to the provided cb_func and cb_post_func around the actual
+        underlying method
+        """
+        if self.cb_func:
+            self.cb_func(*args, **kwargs)
+        result = self._wrapped_method(*args, **kwargs)
+        if self.cb_post_func:
+            new_result = self.cb_post_func(result, args, kwargs)
+            if isinstance(new_result, SpyObjectResult):
+                result = new_result.value
+        return result
+
     def __exit__(self, *exc_info):
         if self._patched_object:
             self._patched_object.stop()
             self._safe_debug_log("Spying stopped on method %s of object %s", self.target_method, self.target_obj)
             self._patched_object = None
+            self._wrapped_method = None
 
     @staticmethod
     def _safe_debug_log(msg, *args):
@@ -130,6 +128,8 @@ class SpyObject(ExplicitContextManagerMixin, ContextDecorator):
         This is because some of the underlying formatted data may not have a proper str method and instead of complete
         failure for a debug log we just want to miss out on the log message.
         """
+        if not LOG.isEnabledFor(logging.DEBUG):
+            return
         try:
             LOG.debug(msg, *args)
         except (TypeError, AttributeError):
@@ -140,6 +140,22 @@ class SpyObject(ExplicitContextManagerMixin, ContextDecorator):
 spy_object = SpyObject  # pylint: disable=invalid-name
 
 
+#: Upper bound on the read buffer used for the files which are patched in as file-like responses
+_MAX_RESPONSE_BUFFER_SIZE = 1 << 20
+
+
+def _get_response_buffer_size(filename):
+    """Returns the buffer size to use when opening `filename` as a file-like response, which is large enough for the
+    file to be read with as few reads as possible up to `_MAX_RESPONSE_BUFFER_SIZE`.  If the size of the file cannot be
+    determined then -1 is returned so the default buffering is used.
+    """
+    try:
+        file_size = os.path.getsize(filename)
+    except OSError:
+        return -1
+    return min(_MAX_RESPONSE_BUFFER_SIZE, max(file_size, io.DEFAULT_BUFFER_SIZE))
+
+
 class PatchFilelikeResponse(ExplicitContextDecorator):
     """Mock a function which expects a file-like response object, using a file's contents as the replacement."""
     patch_method = None
@@ -172,7 +188,7 @@ class PatchFilelikeResponse(ExplicitContextDecorator):
         else:
             self.patch_method = patch.object(self._patch_module, self._target_method)
 
-        self.open_file = io.open(self._filename, 'r')
+        self.open_file = io.open(self._filename, 'r', buffering=_get_response_buffer_size(self._filename))
         mock_method = self.patch_method.start()
         mock_method.return_value = self.open_file
 
@@ -2,7 +2,8 @@
 """
 from nose.plugins import attrib
 
-from generic_utils.decorator_tools import decorator
+#: Cache of the nose attr decorators returned from `get_attr_decorator` keyed by the attribute key and values they set
+_attr_decorators = {}  # pylint: disable=invalid-name
 
 
 def nose_attr_decorator(attr_key, attr_func=None, allow_multiple_values=True):
@@ -21,9 +22,8 @@ def nose_attr_decorator(attr_key, attr_func=None, allow_multiple_values=True):
     :return: A func which is a generated decorator which acts as a specialized nose attrib decorator with pre-filled
         values.
     """
-    @decorator
-    def wrapper(func, *args, **kwargs):
-        """Decorator wrapper method which decorates `func`"""
+    def decorate(func, args, kwargs):
+        """Applies the attribute value(s) derived from `args` and `kwargs` to `func`"""
         if attr_func:
             values = attr_func(*args, **kwargs)
         else:
@@ -32,6 +32,16 @@ def nose_attr_decorator(attr_key, attr_func=None, allow_multiple_values=True):
         return get_attrib_decorated_func(func, attr_key,
                                          values=values,
                                          allow_multiple_values=allow_multiple_values)
+
+    def wrapper(*args, **kwargs):
+        """Decorator which can be used with args (e.g. decorator("value")) or as an arg-less decorator"""
+        if len(args) == 1 and not kwargs and callable(args[0]):
+            return decorate(args[0], (), {})
+
+        def decorator_with_args(func):
+            """Decorates `func` with the args provided to the decorator"""
+            return decorate(func, args, kwargs)
+        return decorator_with_args
     return wrapper
 
 
@@ -54,19 +64,38 @@ def get_attrib_decorated_func(func, attr_key, values=None, allow_multiple_values
     if current_values and not allow_multiple_values:
         # Attribute is already set, so no need to further decorate
         return func
-    final_values = list(values)
-
     if current_values:
-        final_values.extend(list(current_values))
+        final_values = tuple(values) + tuple(current_values)
+    elif isinstance(values, tuple):
+        final_values = values
+    else:
+        final_values = tuple(values)
 
-    attrs = {
-        attr_key: tuple(final_values)
-    }
-
-    attr_wrapped = attrib.attr(**attrs)
+    attr_wrapped = get_attr_decorator(attr_key, final_values)
     return attr_wrapped(func)
 
 
+def get_attr_decorator(attr_key, values):
+    """Returns a nose `attr` decorator which sets `values` to the attr `attr_key` of the functions it decorates.  The
+    decorators are cached by `attr_key` and `values` as the same attributes are generally applied to many tests.
+
+    :param attr_key: The attr key to set `values` to
+    :param values: The value(s) to set to the specified key
+    :type values: tuple
+    :return: A nose `attr` decorator
+    :rtype: func
+    """
+    key = (attr_key, values)
+    try:
+        return _attr_decorators[key]
+    except KeyError:
+        attr_wrapped = _attr_decorators[key] = attrib.attr(**{attr_key: values})
+    except TypeError:
+        # Unhashable values, so there is no caching them
+        attr_wrapped = attrib.attr(**{attr_key: values})
+    return attr_wrapped
+
+
 def specialize_attr_decorator(attr_decorator, *curried_args):
     """Helper method for generating a specialized attr_decorator pegged with specific values to be passed down to it
     to set for the attrib
@@ -75,9 +104,10 @@ def specialize_attr_decorator(attr_decorator, *curried_args):
     :return: A decorator which is capable of being used with or without arguments which then applies the named category
         to the underlying decorated method
     """
-    @decorator
     def _wrapper(func=None):
         """Decorator wrapper method which allows for being called with args (e.g. decorator() vs just decorator) or as
         an arg-less decorator"""
+        if func is None:
+            return _wrapper
         return attr_decorator(*curried_args)(func)
     return _wrapper
@@ -1,9 +1,16 @@
 """Helpers for programs that use threading
 """
+# future/compat
+import six
+
 # stdlib
 import copy
 import threading
 
+#: Types of values which are immutable and can be shared by the deepcopy rather than going through `copy.deepcopy`.
+#: Containers such as tuple are not included as they may hold mutable values.
+_ATOMIC_TYPES = frozenset((type(None), bool, float, complex, bytes, six.text_type) + six.integer_types)
+
 
 class CopyableLocal(threading.local):
     """A subclass of threading.local which provides additional features for deepcopy.
@@ -19,8 +26,11 @@ class CopyableLocal(threading.local):
         cls = self.__class__
         result = cls.__new__(cls)
         memodict[id(self)] = result
+        deepcopy = copy.deepcopy
         for key, value in self.__dict__.items():
-            setattr(result, key, copy.deepcopy(value, memodict))
+            if type(value) not in _ATOMIC_TYPES:
+                value = deepcopy(value, memodict)
+            setattr(result, key, value)
         return result
 
 
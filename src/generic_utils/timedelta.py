@@ -1,12 +1,8 @@
-from __future__ import division
-
-# TODO REMOVE just use .total_seconds() once Python 2.7 is out everywhere
-# This method is only needed because Python 2.7 is not deployed everywhere just yet.
-from past.utils import old_div
-
-
 def get_total_seconds(delta):
-    if hasattr(delta, "total_seconds"):
-        return delta.total_seconds()
-    else:
-        return old_div((delta.microseconds + (delta.seconds + delta.days * 24 * 3600) * 10 ** 6), 10 ** 6)
+    """Returns the total number of seconds in the `delta` timedelta.  This is kept for backwards compatibility and just
+    defers to `timedelta.total_seconds` which is available on all supported versions of Python.
+
+    :type delta: datetime.timedelta
+    :rtype: float
+    """
+    return delta.total_seconds()
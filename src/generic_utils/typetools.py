@@ -3,8 +3,8 @@ from __future__ import absolute_import
 # future/compat
 import six
 
-# stdlib
-import collections
+#: The upper cased string values which `parse_bool` interprets as `True`
+_TRUE_STRINGS = frozenset(("TRUE", "YES", "1", "T"))
 
 
 def is_iterable(obj, exclude_string=True):
@@ -15,10 +15,11 @@ def is_iterable(obj, exclude_string=True):
     :return: Whether or not the provided `obj` is iterable
     :rtype: bool
     """
-    if exclude_string and isinstance(obj, six.string_types):
+    if exclude_string and (type(obj) is str or isinstance(obj, six.string_types)):
         return False
 
-    return isinstance(obj, collections.Iterable)
+    # This is the same check that `collections.Iterable` does, without going through the ABC instance check machinery
+    return getattr(type(obj), "__iter__", None) is not None
 
 
 def as_iterable(obj, exclude_string=True, iter_type=list):
@@ -47,7 +48,11 @@ def as_iterable(obj, exclude_string=True, iter_type=list):
     """
     if obj is None:
         return iter_type()
-    if is_iterable(obj, exclude_string):
+    # This is `is_iterable` inlined as this is called frequently
+    obj_type = type(obj)
+    if exclude_string and (obj_type is str or isinstance(obj, six.string_types)):
+        return iter_type([obj])
+    if getattr(obj_type, "__iter__", None) is not None:
         return obj
     return iter_type([obj])
 
@@ -60,10 +65,7 @@ def parse_bool(bool_str):
     :return: Bool interpretation of `bool_str`
     :rtype: bool
     """
-    try:
-        if bool_str and isinstance(bool_str, six.string_types):
-            return bool_str.upper() in ["TRUE", "YES", "1", "T"]
-    except TypeError:
-        pass
+    if type(bool_str) is str or isinstance(bool_str, six.string_types):
+        return bool_str.upper() in _TRUE_STRINGS
 
     return False
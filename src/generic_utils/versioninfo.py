@@ -4,12 +4,9 @@ from __future__ import absolute_import
 import six
 
 # stdlib
-import calendar
-import datetime
 import hashlib
 import os
 import re
-from functools import reduce
 
 from generic_utils import five
 from generic_utils.mixins import comparable
@@ -44,6 +41,11 @@ VERSION_RE = "".join([
 ])
 del _optional
 
+_VERSION_RE = re.compile(VERSION_RE)
+
+# Matches a version attribute assignment line within a __version__.py file, capturing the attribute field name and value
+_VERSION_LINE_RE = re.compile(re.escape(VERSION_PATTERN_PREFIX) + r"([^\W_]+)__\s*=\s*(-?\d+)\s*$")
+
 # A list of the possible regex named groups in the VERSION_RE which represent the build number
 BUILD_VAL_NAMES = ["build", "build_v2"]
 
@@ -59,7 +61,7 @@ except ImportError:
 
 class Version(comparable.ComparableMixin):
     def __init__(self, major, year=None, week=None, patch=None, build=None):
-        if isinstance(major, six.string_types) and year is None:
+        if year is None and (type(major) is str or isinstance(major, six.string_types)):
             ver = Version.from_string(major)
             if ver is None:
                 raise ValueError("'%s' is not a valid version string" % major)
@@ -92,7 +94,8 @@ class Version(comparable.ComparableMixin):
         :return:
         :rtype: bool
         """
-        if isinstance(other, six.string_types):
+        # Comparisons between Versions are the common case, so they skip the string checks entirely
+        if type(other) is not Version and (type(other) is str or isinstance(other, six.string_types)):
             other = Version(other)
         return super(Version, self)._compare(other, method)
 
@@ -117,9 +120,9 @@ class Version(comparable.ComparableMixin):
             try:
                 full_version = '%s-%d' % (full_version, self.build)
             except TypeError:
+                # full_version is already the version string without the build, so there is nothing more to do
                 if log:
                     log.debug("Tried to get full version with build, but build was not set.")
-                full_version = self.to_version_string(always_include_patch, always_include_build=False)
 
         return full_version
 
@@ -152,31 +155,36 @@ class Version(comparable.ComparableMixin):
                 is not a valid version string
         :rtype: Version
         """
-        match = re.match(VERSION_RE, version_string.strip())
+        match = _VERSION_RE.match(version_string.strip())
 
         if not match:
             return None
 
-        build_val = reduce(
-            lambda x, y: x or y,
-            [match.group(name) and int(match.group(name)) for name in BUILD_VAL_NAMES])
+        groups = match.groupdict()
+        build_val = None
+        for name in BUILD_VAL_NAMES:
+            build_val = groups[name] and int(groups[name])
+            if build_val:
+                break
 
-        return Version(
-            match.group("major") and int(match.group("major")),
-            match.group("year") and int(match.group("year")),
-            match.group("week") and int(match.group("week")),
-            match.group("patch") and int(match.group("patch")),
-            build_val
-        )
+        major, year, week, patch = [groups[name] and int(groups[name]) for name in ("major", "year", "week", "patch")]
+        return Version(major, year, week, patch, build_val)
 
-    @classmethod
-    def _is_long_year(cls, year):
+    @staticmethod
+    def _is_long_year(year):
         """Returns whether or not the provided year has 53 work weeks(long) or not(short)
         """
-        first_day_of_year = datetime.date(year, 1, 1)
-        weekday = first_day_of_year.weekday()
+        # The weekday of the first day of the year is computed directly from its proleptic Gregorian ordinal, the same
+        # as datetime.date(year, 1, 1).weekday() does, without having to create the date
+        prev_year = year - 1
+        weekday = (prev_year * 365 + prev_year // 4 - prev_year // 100 + prev_year // 400) % 7
+        is_leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+        return weekday == WEDNESDAY if is_leap else weekday == THURSDAY
 
-        return weekday == WEDNESDAY if calendar.isleap(year) else weekday == THURSDAY
+
+#: Cache of the version components of the modules which have been looked up by `get_module_version` by module name
+_module_versions = {}  # pylint: disable=invalid-name
 
 
 def get_version_info(module_names):
@@ -204,6 +212,11 @@ def get_module_version(module_name):
     :return: A `Version` representation of the version of the requested `module_name`
     :rtype: Version
     """
+    try:
+        return Version(*_module_versions[module_name])
+    except KeyError:
+        pass
+
     try:
         version_module = __import__('.'.join([module_name, "__version__"]), fromlist=["*"])
     except:
@@ -211,22 +224,21 @@ def get_module_version(module_name):
             log.error('failed to import __version__ for module %s.' % module_name)
         return None
 
-    module_name = module_name
-
-    if not hasattr(version_module, VERSION_MAJOR_ATTRIBUTE) or \
-            not hasattr(version_module, VERSION_YEAR_ATTRIBUTE) or \
-            not hasattr(version_module, VERSION_WEEK_ATTRIBUTE):
+    module_attrs = vars(version_module)
+    try:
+        major = module_attrs[VERSION_MAJOR_ATTRIBUTE]
+        year = module_attrs[VERSION_YEAR_ATTRIBUTE]
+        week = module_attrs[VERSION_WEEK_ATTRIBUTE]
+    except KeyError:
         raise ImportError('version information not found in %s.' % module_name)
 
-    major = getattr(version_module, VERSION_MAJOR_ATTRIBUTE)
-    year = getattr(version_module, VERSION_YEAR_ATTRIBUTE)
-    week = getattr(version_module, VERSION_WEEK_ATTRIBUTE)
-    patch = getattr(version_module, VERSION_PATCH_ATTRIBUTE, 0)
+    patch = module_attrs.get(VERSION_PATCH_ATTRIBUTE, 0)
     if patch < 0:
         patch = 0
-    build = getattr(version_module, VERSION_BUILD_ATTRIBUTE, None)
+    build = module_attrs.get(VERSION_BUILD_ATTRIBUTE)
 
-    return Version(major, year, week, patch, build)
+    version_components = _module_versions[module_name] = (major, year, week, patch, build)
+    return Version(*version_components)
 
 
 def get_module_version_by_filepath(module_name, base_dir=None):
@@ -248,12 +260,11 @@ def get_module_version_by_filepath(module_name, base_dir=None):
     }
 
     with open(init_filename, "r") as init_file:
-        for line in init_file.readlines():
-            line = line.strip('\n')
-            if line.find(VERSION_PATTERN_PREFIX) == 0:
-                name, val = line.split("=")
-                trash, field = name.strip('_ ').split('_')
-                values[field] = int(val)
+        for line in init_file:
+            if line.startswith(VERSION_PATTERN_PREFIX):
+                match = _VERSION_LINE_RE.match(line)
+                if match:
+                    values[match.group(1)] = int(match.group(2))
 
     return Version(**values)
 
@@ -289,9 +300,12 @@ class GuidMixin(object):
             log.debug("Attempted to generate guid for instance of %s, but _get_guid_inputs is not implemented.")
             raise ValueError("Unabled to generate GUID")
 
-        inputs = [input_value.replace(self.GUID_INPUTS_SEPARATOR, self.GUID_INPUTS_ESCAPE)
+        separator = self.GUID_INPUTS_SEPARATOR
+        escape = self.GUID_INPUTS_ESCAPE
+        inputs = [input_value.replace(separator, escape) if separator in input_value else input_value
                   for input_value in inputs_to_guid]
-        guid.update(five.b(self.GUID_INPUTS_SEPARATOR.join(inputs)))
+        # All of the inputs are fed to the hash in a single update call
+        guid.update(five.b(separator.join(inputs)))
         return guid.hexdigest()
 
     def _get_guid_inputs(self):
@@ -1,5 +1,6 @@
 """Tests for generic_utils.collections.pipeline"""
 # stdlib
+import functools
 from unittest import TestCase
 
 from nose.tools import nottest
@@ -13,10 +14,22 @@ from generic_utils.collections.pipeline import Pipeline
 LOG = loggingtools.getLogger()
 
 # pylint: disable=invalid-name
-a = lambda x: x + 1
-b = lambda x: x + 2 if x else 100
-c = lambda x: x + 3
-d = lambda x: x + 4
+
+
+def a(x):
+    return x + 1
+
+
+def b(x):
+    return x + 2 if x else 100
+
+
+def c(x):
+    return x + 3
+
+
+def d(x):
+    return x + 4
 # pylint: enable=invalid-name
 
 
@@ -51,13 +64,48 @@ def test_transition_filter(self, stage_func, intermediate_result):
 DEFAULT_TRANS_FILTER_RESULT = FULL_PIPELINE_RESULT_VAL
 
 
+SUCCESS_EXIT_RESULT = int(STAGE_B_ADD_VAL)
+ERROR_EXIT_RESULT = 4
+
+
+def success_exit_filter(test_case, pipeline_self, stage_func, intermediate_result):
+    """Transition filter which exits the pipeline with success after stage_b when it was run with the default value"""
+    if stage_func == stage_b and intermediate_result == STAGE_B_ADD_VAL:
+        intermediate_result = int(intermediate_result)  # conversion of the result.
+        raise PipelineSuccessExit(pipeline_self, intermediate_result)
+    elif stage_func == stage_b and intermediate_result == STAGE_B_CONTINUE_VAL:
+        LOG.debug("Continuing pipeline from stage_b with result = %s", intermediate_result)
+        return intermediate_result
+    elif stage_func == stage_c and intermediate_result != FULL_PIPELINE_RESULT_VAL:
+        test_case.fail("stage_c completed but result is not what expected %s %s" % (intermediate_result,
+                                                                                    FULL_PIPELINE_RESULT_VAL))
+    else:
+        LOG.debug("stage_func %r completed with intermediate_result=%s" % (stage_func, intermediate_result))
+        return intermediate_result
+
+
+def error_exit_filter(test_case, pipeline_self, stage_func, intermediate_result):
+    """Transition filter which exits the pipeline with an error after stage_b when it was run with the default value"""
+    if stage_func == stage_b and intermediate_result == STAGE_B_ADD_VAL:
+        ### Transformation of result.
+        intermediate_result = ERROR_EXIT_RESULT
+        raise PipelineErrorExit(pipeline_self, intermediate_result)
+    elif stage_func == stage_c:
+        ### Pipelines should never call transition with their final stage.
+        test_case.fail("Filter should have raised PipelineErrorExit and this should not get called.")
+    else:
+        return intermediate_result
+
+
 def do_nothing(previous_result):
     assert type(previous_result) is int, "Integer is expected as input."
 
 
 class PipelineTestCase(TestCase):
-    def setUp(self):
-        self.pipeline = Pipeline(a, b, c)
+    @classmethod
+    def setUpClass(cls):
+        # The shared pipeline is never modified by the tests, so it only needs to be built once
+        cls.pipeline = Pipeline(a, b, c)
 
     def test_pipeline(self):
         self.assertEqual(self.pipeline.start(1), 7)
@@ -79,14 +127,14 @@ class PipelineTestCase(TestCase):
     def test_get_next_stage(self):
         """Validate behavior of _get_next_stage method.
         """
-        EXPECTATION_MAP = {
-            None: a,
-            a: b,
-            b: c,
-            c: None,
-            d: InvalidStageException
-        }
-        for stage_func, expectation in EXPECTATION_MAP.items():
+        EXPECTATIONS = (
+            (None, a),
+            (a, b),
+            (b, c),
+            (c, None),
+            (d, InvalidStageException)
+        )
+        for stage_func, expectation in EXPECTATIONS:
             if expectation is InvalidStageException:
                 with self.assertRaises(expectation):
                     self.pipeline._get_next_stage(stage_func)
@@ -96,51 +144,26 @@ class PipelineTestCase(TestCase):
     def test_success_exit(self):
         """Validate Pipeline can be exited gracefully in a success state.
         """
-        EXPECTED_EXIT_TRANSFORM_RESULT = int(STAGE_B_ADD_VAL)
-
-        def test_filter(pipeline_self, stage_func, intermediate_result):
-            if stage_func == stage_b and intermediate_result == STAGE_B_ADD_VAL:
-                intermediate_result = int(intermediate_result)  # conversion of the result.
-                raise PipelineSuccessExit(pipeline_self, intermediate_result)
-            elif stage_func == stage_b and intermediate_result == STAGE_B_CONTINUE_VAL:
-                LOG.debug("Continuing pipeline from stage_b with result = %s", intermediate_result)
-                return intermediate_result
-            elif stage_func == stage_c and intermediate_result != FULL_PIPELINE_RESULT_VAL:
-                self.fail("stage_c completed but result is not what expected %s %s" % (intermediate_result,
-                                                                                       FULL_PIPELINE_RESULT_VAL))
-            else:
-                LOG.debug("stage_func %r completed with intermediate_result=%s" % (stage_func, intermediate_result))
-                return intermediate_result
-
-        self._do_exit_condition_tests(test_filter, EXPECTED_EXIT_TRANSFORM_RESULT)
-        self._do_exit_condition_tests(test_filter, FULL_PIPELINE_RESULT_VAL, True)
+        trans_filter = functools.partial(success_exit_filter, self)
+        test_pipeline = Pipeline(stage_a, stage_b, stage_c, transition_filters=trans_filter)
+        self._do_exit_condition_tests(test_pipeline, SUCCESS_EXIT_RESULT)
+        self._do_exit_condition_tests(test_pipeline, FULL_PIPELINE_RESULT_VAL, True)
 
     def test_error_exit(self):
         """Validate error condition exits work as expected."""
-        EXIT_RESULT = 4
-
-        def test_filter(pipeline_self, stage_func, intermediate_result):
-            if stage_func == stage_b and intermediate_result == STAGE_B_ADD_VAL:
-                ### Transformation of result.
-                intermediate_result = EXIT_RESULT
-                raise PipelineErrorExit(pipeline_self, intermediate_result)
-            elif stage_func == stage_c:
-                ### Pipelines should never call transition with their final stage.
-                self.fail("Filter should have raised PipelineErrorExit and this should not get called.")
-            else:
-                return intermediate_result
-
+        trans_filter = functools.partial(error_exit_filter, self)
+        test_pipeline = Pipeline(stage_a, stage_b, stage_c, transition_filters=trans_filter)
         exit_err = None
         try:
-            self._do_exit_condition_tests(test_filter, EXIT_RESULT)
+            self._do_exit_condition_tests(test_pipeline, ERROR_EXIT_RESULT)
         except PipelineErrorExit as err:
             LOG.debug("Raised PipelineErrorExit as expected, %r", err)
             exit_err = err
         self.assertIsNotNone(exit_err)
-        self.assertEqual(EXIT_RESULT, exit_err.intermediate_result)
+        self.assertEqual(ERROR_EXIT_RESULT, exit_err.intermediate_result)
 
         ### Validate the transition filter does not get called after the final stage.
-        self._do_exit_condition_tests(test_filter, FULL_PIPELINE_RESULT_VAL, True)
+        self._do_exit_condition_tests(test_pipeline, FULL_PIPELINE_RESULT_VAL, True)
 
     def test_transition_filter(self):
         """Validate transition filter only affects the pipeline instance on which it is called."""
@@ -166,10 +189,9 @@ class PipelineTestCase(TestCase):
         ### Increase expected result (1*n, n=number of steps - 1)
         self.assertEqual(new_pipeline.start(True), AFTER_RESULT_TOTAL + 2, "multiple trans filters should get executed")
 
-    def _do_exit_condition_tests(self, trans_filter, expected_result, *pipeline_callargs):
-        """Run the pipeline and validate filter works as expected.
+    def _do_exit_condition_tests(self, test_pipeline, expected_result, *pipeline_callargs):
+        """Run the pipeline and validate filter works as expected.  Transition filters do not keep any state between
+        runs, so the same `test_pipeline` can be run multiple times.
         """
-        ### SETUP
-        test_pipeline = Pipeline(stage_a, stage_b, stage_c, transition_filters=trans_filter)
         pipeline_result = test_pipeline.start(*pipeline_callargs)
         self.assertEqual(pipeline_result, expected_result)
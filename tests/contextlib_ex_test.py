@@ -1,5 +1,6 @@
 # stdlib
 import logging
+import threading
 from unittest import TestCase
 
 from generic_utils.contextlib_ex import ExplicitContextDecorator
@@ -7,17 +8,19 @@ from generic_utils.contextlib_ex import ExplicitContextDecorator
 log = logging.getLogger(__name__)
 
 
-context_manager_test_dict = {}  # pylint: disable=invalid-name
+#: Per thread state set by the dummy context managers and tests so that test runners executing tests in separate threads
+#: do not see each other's state
+context_manager_state = threading.local()  # pylint: disable=invalid-name
 
 
 class DummyContextManager(ExplicitContextDecorator):
     dict_key = None
 
     def __enter__(self):
-        context_manager_test_dict[self.dict_key] = True
+        setattr(context_manager_state, self.dict_key, True)
 
     def __exit__(self, *exc_info):
-        del context_manager_test_dict[self.dict_key]
+        delattr(context_manager_state, self.dict_key)
 
 
 class ClassDummyContextManager(DummyContextManager):
@@ -37,10 +40,10 @@ class ContextDecoratorTestCase(TestCase):
     def test_context_manager_decorator_enablement(self):
         """Validates that the target test context managers are active when being used as decorators
         """
-        self.assertTrue(context_manager_test_dict["class"])
-        self.assertTrue(context_manager_test_dict["func"])
+        self.assertTrue(getattr(context_manager_state, "class", False))
+        self.assertTrue(getattr(context_manager_state, "func", False))
 
-        context_manager_test_dict["context_decorator_testcase_ran"] = True
+        context_manager_state.context_decorator_testcase_ran = True
 
 
 class DidContextDecoratorTestCaseRun(TestCase):
@@ -53,4 +56,4 @@ class DidContextDecoratorTestCaseRun(TestCase):
     """
 
     def test_did_it_run(self):
-        self.assertTrue(context_manager_test_dict["context_decorator_testcase_ran"])
+        self.assertTrue(getattr(context_manager_state, "context_decorator_testcase_ran", False))
@@ -21,28 +21,39 @@ LOG = logging.getLogger(__name__)
 pacific = timezone("US/Pacific")
 US_EASTERN = timezone("US/Eastern")
 AUSTRALIA_SYDNEY = timezone("Australia/Sydney")
+AMERICA_CHICAGO = timezone("America/Chicago")
+EUROPE_PARIS = timezone("Europe/Paris")
+AMERICA_GRENADA = timezone("America/Grenada")
+
+ONE_HOUR_IN_MS = 60 * 60 * 1000
+
+#: (datetime, expected milliseconds since epoch) test cases
+TO_MILLISECONDS_TEST_CASES = (
+    (EPOCH, 0),
+    (EPOCH + timedelta(days=1), 86400000),
+    (EPOCH + timedelta(weeks=1), 604800000),
+    (pacific.localize(datetime(1970, 1, 1)),   # confirm timezone conversion.
+     ONE_HOUR_IN_MS * 8),
+)
+
+#: (milliseconds since epoch, expected datetime) test cases
+FROM_MILLISECONDS_TEST_CASES = (
+    (0, EPOCH),
+    (86400000, EPOCH + timedelta(days=1)),
+    (604800000, EPOCH + timedelta(weeks=1)),
+)
 
 
 class MillisecondsConversionTestCase(TestCase):
     """
     Test Case for conversions to and from milliseconds.
     """
-    def setUp(self):
-        self.one_hour_in_ms = 60 * 60 * 1000
-
     def test_milliseconds_since_epoch(self):
         """
         Test the milliseconds_since_epoch to ensure we can get from milliseconds utc since epoch TO a datetime object.
         :return:
         """
-        test_cases = [
-            (EPOCH, 0),
-            (EPOCH + timedelta(days=1), 86400000),
-            (EPOCH + timedelta(weeks=1), 604800000),
-            (pacific.localize(datetime(1970, 1, 1)),   # confirm timezone conversion.
-             self.one_hour_in_ms * 8),
-        ]
-        for convert_from, expected_milliseconds in test_cases:
+        for convert_from, expected_milliseconds in TO_MILLISECONDS_TEST_CASES:
             self.assertEqual(milliseconds_since_epoch(convert_from), expected_milliseconds)
 
         with self.assertRaises(ValueError):
@@ -55,12 +66,7 @@ class MillisecondsConversionTestCase(TestCase):
         datetime object.
         :return:
         """
-        test_cases = [
-            (0, EPOCH),
-            (86400000, EPOCH + timedelta(days=1)),
-            (604800000, EPOCH + timedelta(weeks=1)),
-        ]
-        for convert_from, expected_datetime in test_cases:
+        for convert_from, expected_datetime in FROM_MILLISECONDS_TEST_CASES:
             self.assertEqual(datetime_from_milliseconds(convert_from), expected_datetime)
 
 
@@ -81,8 +87,8 @@ class TimezoneOffsetUseCases(TestCase):
         for expected_offset, tz, frozen_now in test_cases:
             with freeze_time(frozen_now):
                 offset = get_timezone_offset_string(tz)
-                self.assertEqual(expected_offset, offset,
-                                 "Offset is different from expected.  %s != %s" % (offset, expected_offset))
+                # assertEqual already reports both offsets on failure, so no message needs to be built for each case
+                self.assertEqual(expected_offset, offset)
 
     def test_supports_dst(self):
         """
@@ -96,20 +102,21 @@ class TimezoneOffsetUseCases(TestCase):
         There is a gap when Australia and Chicago are both on DST.  Oct 15th will be chosen for this test.
         :return:
         """
-        with freeze_time(datetime(year=2015, month=10, day=31)):
+        with freeze_time(datetime(year=2015, month=10, day=31)) as frozen_time:
             timezones_tests = [
-                (timezone("Australia/Sydney"), (True, True)),
-                (timezone("America/Chicago"), (True, True)),
-                (timezone("Europe/Paris"), (True, False)),
-                (timezone("America/Grenada"), (False, False))
+                (AUSTRALIA_SYDNEY, (True, True)),
+                (AMERICA_CHICAGO, (True, True)),
+                (EUROPE_PARIS, (True, False)),
+                (AMERICA_GRENADA, (False, False))
             ]
 
             for tz, expected_result in timezones_tests:
                 self.assertEqual(timezone_supports_dst(tz), expected_result)
 
-        with freeze_time(datetime(year=2015, month=11, day=1, hour=12)):
-            self.assertEqual(timezone_supports_dst(timezone("America/Chicago")),
+            # Moving the frozen time reuses the existing patching rather than freezing time again
+            frozen_time.move_to(datetime(year=2015, month=11, day=1, hour=12))
+            self.assertEqual(timezone_supports_dst(AMERICA_CHICAGO),
                              (True, False))
-        with freeze_time(datetime(year=2015, month=10, day=25)):
-            self.assertEqual(timezone_supports_dst(timezone("Europe/Paris")),
+            frozen_time.move_to(datetime(year=2015, month=10, day=25))
+            self.assertEqual(timezone_supports_dst(EUROPE_PARIS),
                              (True, True))
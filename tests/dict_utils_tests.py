@@ -1,30 +1,35 @@
 """Tests for
 """
 # stdlib
+import copy
 from unittest import TestCase
 
 from generic_utils.dict_utils import lower_keys
 
+INPUT_DICT = {
+    "TestKey": [{
+        "NestedTestKey": 1
+    }],
+    "TestKeyTwo": {"NestedTestKeyTwo": 2}
+}
+EXPECTED_NON_RECURSIVE = {
+    "testkey": [{
+        "NestedTestKey": 1
+    }],
+    "testkeytwo": {"NestedTestKeyTwo": 2}
+}
+EXPECTED_RECURSIVE = {
+    "testkey": [{
+        "nestedtestkey": 1
+    }],
+    "testkeytwo": {"nestedtestkeytwo": 2}
+}
+
 
 class DictUtilsTestCase(TestCase):
     def test_lower_keys(self):
-        input_dict = {
-            "TestKey": [{
-                "NestedTestKey": 1
-            }],
-            "TestKeyTwo": {"NestedTestKeyTwo": 2}
-        }
-        EXPECTED_NON_RECURSIVE = {
-            "testkey": [{
-                "NestedTestKey": 1
-            }],
-            "testkeytwo": {"NestedTestKeyTwo": 2}
-        }
-        EXPECTED_RECURSIVE = {
-            "testkey": [{
-                "nestedtestkey": 1
-            }],
-            "testkeytwo": {"nestedtestkeytwo": 2}
-        }
-        self.assertEqual(lower_keys(input_dict, True), EXPECTED_RECURSIVE)
-        self.assertEqual(lower_keys(input_dict), EXPECTED_NON_RECURSIVE)
+        original_input = copy.deepcopy(INPUT_DICT)
+        self.assertEqual(lower_keys(INPUT_DICT, True), EXPECTED_RECURSIVE)
+        self.assertEqual(lower_keys(INPUT_DICT), EXPECTED_NON_RECURSIVE)
+        # lower_keys returns copies, so the shared input must not have been modified
+        self.assertEqual(INPUT_DICT, original_input)
@@ -1,12 +1,11 @@
 from __future__ import absolute_import
 
-# stdlib
-from unittest import TestCase
-
 from generic_utils import loggingtools
 from generic_utils.exceptions import GenUtilsException
 from generic_utils.exceptions import GenUtilsValueError
 from generic_utils.exceptions import IllegalArgumentException
+from generic_utils.test import TestCase
+from generic_utils.test import data
 
 log = loggingtools.getLogger()
 
@@ -75,6 +74,17 @@ class ExceptionTest(TestCase):
         self.assertEqual(my_exception.message, "My custom message - color = Red")
         self.assertEqual(my_exception.color, "Red")
 
+    def test_message_field_access(self):
+        """Validates that message fields can reference inherited attributes as well as items of those attributes
+        """
+        my_exception = MyCustomSubclassException()
+
+        self.assertEqual(my_exception.message, "The color is None and the shape is None")
+
+        my_exception = MyCustomSubclassException("The {shape} is {color[0]}", color="Red", shape="square")
+
+        self.assertEqual(my_exception.message, "The square is R")
+
     def test_custom_value_error(self):
 
         value_error = GenUtilsValueError(value_name="test")
@@ -82,24 +92,16 @@ class ExceptionTest(TestCase):
         self.assertEqual(value_error.value_name, "test")
         self.assertIsInstance(value_error, ValueError)
 
-    def test_fail_on_invalid_kwarg(self):
-        """Validates that if we attempt to provide an invalid kwarg to an exception that it raises an exception
+    @data("no_attr", "__init__", "_some_private_prop", "some_method")
+    def test_fail_on_invalid_kwarg(self, kwarg_name):
+        """Validates that if we attempt to provide an invalid kwarg '{0}' to an exception that it raises an exception
         """
-        TEST_CASES = [
-            ("no_attr",),
-            ("__init__",),
-            ("_some_private_prop",),
-            ("some_method",)
-        ]
-
-        for kwarg_name, in TEST_CASES:
-            log.debug("Testing kwarg '%s'", kwarg_name)
-            kwargs = {
-                kwarg_name: "Some Test Value"
-            }
-
-            with self.assertRaises(IllegalArgumentException):
-                MyCustomSubclassException(**kwargs)
+        kwargs = {
+            kwarg_name: "Some Test Value"
+        }
+
+        with self.assertRaises(IllegalArgumentException):
+            MyCustomSubclassException(**kwargs)
 
     def test_exception_no_message(self):
         """Validate that if no message provided to exception then error is not thrown
@@ -9,28 +9,30 @@ from generic_utils.exceptions.utils import suppress_safe_exceptions
 
 LOG = loggingtools.getLogger()
 
+#: Exception types which are suppressed by `suppress_safe_exceptions` by default
+SUPPRESSED_BY_DEFAULT = (ArithmeticError, AttributeError, LookupError, TypeError, ValueError)
+
+#: Exception types which are not suppressed by `suppress_safe_exceptions` by default
+RAISED_BY_DEFAULT = (BufferError, EnvironmentError, EOFError, ImportError, MemoryError, NameError, ReferenceError,
+                     RuntimeError, SyntaxError)
+
+#: suppress_safe_exceptions keeps no state between uses, so a single instance is shared by the context manager tests
+DEFAULT_SUPPRESS = suppress_safe_exceptions()
 
 
 class SuppressSafeExceptionsTestCase(TestCase):
     """Validate behavior of SuppressSafeExceptions decorator / context manager"""
 
     def test_basic(self):
-        suppressed_defaults = [
-            ArithmeticError(), AttributeError(), LookupError(), TypeError(), ValueError()
-        ]
-        should_raise = [
-            BufferError(), EnvironmentError(), EOFError(), ImportError(), MemoryError(), NameError(), ReferenceError(),
-            RuntimeError(), SyntaxError()
-        ]
-        for exc in suppressed_defaults:
-            self._suppress_as_context_mgr(exc)
-            self._suppress_as_decorator(exc)
-
-        for exc in should_raise:
-            with self.assertRaises(exc.__class__):
-                self._suppress_as_context_mgr(exc)
-            with self.assertRaises(exc.__class__):
-                self._suppress_as_decorator(exc)
+        for exc_class in SUPPRESSED_BY_DEFAULT:
+            self._suppress_as_context_mgr(exc_class())
+            self._suppress_as_decorator(exc_class())
+
+        for exc_class in RAISED_BY_DEFAULT:
+            with self.assertRaises(exc_class):
+                self._suppress_as_context_mgr(exc_class())
+            with self.assertRaises(exc_class):
+                self._suppress_as_decorator(exc_class())
 
     def test_suppress_configured_types(self):
         """Validate types listed in config SAFE_EXCEPTION_CLASSES are suppressed"""
@@ -70,7 +72,7 @@ class SuppressSafeExceptionsTestCase(TestCase):
         :return:
         :rtype:
         """
-        with suppress_safe_exceptions():
+        with DEFAULT_SUPPRESS:
             raise exc
 
     @staticmethod
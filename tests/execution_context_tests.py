@@ -11,6 +11,8 @@ from generic_utils.execution_context import ExecutionContextStackEmptyError
 from generic_utils.execution_context import ThreadLocalExecutionContext
 from generic_utils.execution_context import as_execution_context
 from generic_utils.execution_context import execution_context_stack
+from generic_utils.execution_context import restore
+from generic_utils.execution_context import snapshot
 from generic_utils.execution_context.exceptions import ExecutionContextValueDoesNotExist
 from generic_utils.json_tools.serialization import dumps
 from generic_utils.json_tools.serialization import loads
@@ -18,9 +20,15 @@ from generic_utils.test import TestCase
 
 LOG = loggingtools.getLogger()
 
+_MISSING = object()
+
+TEST_KEY = "test key"
+TEST_VALUE = "test value"
+TEST_DATETIME_KEY = "test_datetime_key"
+
 
 class DummyExecutionContext(BaseExecutionContext):
-    __storage = None
+    _storage = None
 
     def __init__(self, initial_context=None):
         """
@@ -29,25 +37,22 @@ class DummyExecutionContext(BaseExecutionContext):
         :return:
         :rtype:
         """
-        self.__storage = {}
-        if initial_context:
-            self.__storage.update(initial_context)
+        self._storage = dict(initial_context or ())
         super(DummyExecutionContext, self).__init__(initial_context)
 
     def get(self, key, default=NOTSET):
         """Get value from local dict
         """
-        try:
-            return self.__storage[key]
-        except KeyError:
+        val = self._storage.get(key, _MISSING)
+        if val is _MISSING:
             if default == NOTSET:
                 raise ExecutionContextValueDoesNotExist(key=key)
-            else:
-                return default
+            return default
+        return val
 
     def set(self, key, val):
         """Set dict value"""
-        self.__storage[key] = val
+        self._storage[key] = val
 
 
 class ExecutionContextTestCase(TestCase):
@@ -61,9 +66,6 @@ class ExecutionContextTestCase(TestCase):
     def test_set(self):
         """Validate setting a value sets value to first execution context matching type from right to left.
         """
-        TEST_KEY = 'test key'  # pylint: disable=invalid-name
-        TEST_VALUE = 'test value'  # pylint: disable=invalid-name
-
         dummy_ctx = DummyExecutionContext()
         execution_context_stack.push(dummy_ctx)
 
@@ -134,23 +136,21 @@ class ExecutionContextTestCase(TestCase):
         """Validate behavior of pop to item
         """
         keep_context = ThreadLocalExecutionContext()
+        middle_context = ThreadLocalExecutionContext()
         top_context = ThreadLocalExecutionContext()
-        exec_contexts = [keep_context, top_context]
+        exec_contexts = [keep_context, middle_context, top_context]
 
         with self.assertRaises(GenUtilsValueError):
             execution_context_stack.pop_to_item(keep_context)
 
         execution_context_stack.extend(exec_contexts)
-        execution_context_stack.pop_to_item(keep_context)
+        self.assertEqual(execution_context_stack.pop_to_item(keep_context), [top_context, middle_context])
 
         self.assertNotIn(top_context, execution_context_stack.current_stack)
         self.assertIn(keep_context, execution_context_stack.current_stack)
 
     def test_to_from_dict(self):
         """Validate to/from dict on ThreadLocalExecutionContext works as expected"""
-        TEST_KEY = "test key"  # pylint: disable=invalid-name
-        TEST_VALUE = "test value"  # pylint: disable=invalid-name
-        TEST_DATETIME_KEY = "test_datetime_key"
         TEST_DATETIME_VALUE = utcnow()
 
         execution_context = ThreadLocalExecutionContext()
@@ -164,6 +164,10 @@ class ExecutionContextTestCase(TestCase):
         self.assertEqual(restored_exec_context.get(TEST_DATETIME_KEY), TEST_DATETIME_VALUE,
                          "Datetime should be serialized / deserialized properly.")
 
+        restored_exec_context = restore(snapshot(execution_context))
+        self.assertEqual(restored_exec_context.get(TEST_KEY), TEST_VALUE)
+        self.assertEqual(restored_exec_context.get(TEST_DATETIME_KEY), TEST_DATETIME_VALUE)
+
     def test_get(self):
         """Validate when a key is requested, the stack is traveled right to left and first value is returned"""
         ### SETUP
@@ -191,6 +195,22 @@ class ExecutionContextTestCase(TestCase):
             # If default is NOTSET, raise Exception
             execution_context_stack.get('nonexistent')
 
+    def test_get_reflects_context_mutation(self):
+        """Validate values set directly on a context already on the stack are immediately visible through the stack
+        """
+        test_key = 'TEST_KEY'
+        bottom_context = DummyExecutionContext({test_key: 'bottom'})
+        top_context = DummyExecutionContext()
+
+        execution_context_stack.extend([bottom_context, top_context])
+        self.assertEqual(execution_context_stack.get(test_key), 'bottom')
+
+        top_context.set(test_key, 'top')
+        self.assertEqual(execution_context_stack.get(test_key), 'top')
+
+        execution_context_stack.pop()
+        self.assertEqual(execution_context_stack.get(test_key), 'bottom')
+
     def test_getstate_setstate(self):
         """Validate behavior of ExecutionContextStack when using the getstate/setstate magicmethods.
         """
@@ -218,6 +238,7 @@ class ExecutionContextTestCase(TestCase):
                 execution_context_stack.get(key)
 
         context_json = dumps(local_exec_stack)
+        context_snapshot = snapshot(local_exec_stack)
         del local_exec_stack
 
         LOG.debug("Context JSON = %s", context_json)
@@ -240,6 +261,11 @@ class ExecutionContextTestCase(TestCase):
 
         self.assertEqual(execution_context_stack.get(test_first_key), test_first_val)
 
+        with as_execution_context(restore(context_snapshot)):
+            self.assertEqual(execution_context_stack.get(context_a_key), "context_a")
+            self.assertEqual(execution_context_stack.get(context_b_key), "context_b")
+        self.assertEqual(begin_stack_length, len(execution_context_stack))
+
     def test_as_exec_context_removes(self):
         """Validate decorator removes any context added while inside the context manager/decorator
         """
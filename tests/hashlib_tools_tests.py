@@ -1,10 +1,9 @@
 """Tests for generic_utils.hashlib_tools
 """
-# future/compat
-import six
-
 # stdlib
+import binascii
 import hashlib
+import io
 import os
 import unittest
 
@@ -14,25 +13,31 @@ from generic_utils.hashlib_tools import get_chunked_hash
 class HashlibToolsTestCase(unittest.TestCase):
     """TestCase for HashlibTools"""
 
-    def test_get_chunked_hash(self):
-        """Validate get_chunked_hash works as expected
+    @classmethod
+    def setUpClass(cls):
+        """Generate the random payload once for the whole class
         """
-        # noinspection PyCallingNonCallable
-        test_output = six.StringIO()
+        super(HashlibToolsTestCase, cls).setUpClass()
         # An odd number of bytes to validate that the result hashes the remainder of len(data) /chunk_size
-        test_data = os.urandom(150000)
-        # Hack for Python 3, StringIO expects string not bytes
-        if not six.PY2:
-            test_data = six.text_type(test_data)
+        cls.test_data = os.urandom(150001)
 
-        test_output.write(test_data)
-        hasher = hashlib.sha256()
-        test_data_encoded = test_data
-
-        if not six.PY2:
-            test_data_encoded = test_data_encoded.encode('utf-8')
+    def test_get_chunked_hash(self):
+        """Validate get_chunked_hash works as expected
+        """
+        test_data = binascii.hexlify(self.test_data).decode("ascii")
+        test_output = io.StringIO(test_data)
 
-        hasher.update(test_data_encoded)
-        expected_hash = hasher.hexdigest()
+        expected_hash = hashlib.sha256(test_data.encode("ascii")).hexdigest()
         actual_hash = get_chunked_hash(test_output)
         self.assertEqual(expected_hash, actual_hash)
+
+    def test_get_chunked_hash_binary(self):
+        """Validate get_chunked_hash works as expected for binary streams
+        """
+        test_data = self.test_data
+        test_output = io.BytesIO(test_data)
+        test_output.seek(0, os.SEEK_END)
+
+        self.assertEqual(hashlib.sha256(test_data).hexdigest(), get_chunked_hash(test_output))
+        self.assertEqual(hashlib.md5(test_data).hexdigest(), get_chunked_hash(test_output, chunk_size=1000,
+                                                                             hash_func=hashlib.md5))
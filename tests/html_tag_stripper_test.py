@@ -13,6 +13,11 @@ class TestHTMLTagStripper(TestCase):
         no_script = strip_tags('<script language="text/javascript">var foo="bar";</script><div>hello world!</div>')
         self.assertEqual(no_script, 'hello world!')
 
+    def test_remove_multiple_script_tags(self):
+        no_script = strip_tags('<script>var foo="bar";</script><div>hello</div><script>var bar="foo";</script>'
+                               '<div> world!</div>')
+        self.assertEqual(no_script, 'hello world!')
+
     def test_remove_cdata_tag(self):
         no_cdata = strip_tags("<title>A Tutorial: <![CDATA[document.write('test');]]></title>")
         self.assertEqual(no_cdata, "A Tutorial: ")
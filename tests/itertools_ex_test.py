@@ -57,6 +57,16 @@ class IteratorProxyTestCase(TestCase):
         results = list(proxy)
         self.assertListEqual(results, expected)
 
+    def test_iterator_skips_none(self):
+        """Validate rows which are None after processing are not yielded and the proxy can be iterated again
+        """
+        test_data = [1, 2, 3, 4]
+        expected = [2, 4]
+
+        proxy = IteratorProxy(test_data, item_processor=lambda x: x if x % 2 == 0 else None)
+        self.assertListEqual(list(proxy), expected)
+        self.assertListEqual(list(proxy), expected)
+
 
 class ReverseEnumerateTestCase(TestCase):
     def test_basic_usage(self):
@@ -72,6 +82,10 @@ class ReverseEnumerateTestCase(TestCase):
 
         self.assertEqual(count, len(my_list))
 
+    def test_generator(self):
+        """Validate iterables without len/reversed support are enumerated in reverse as well"""
+        self.assertListEqual(list(reverse_enumerate(x * 2 for x in range(3))), [(2, 4), (1, 2), (0, 0)])
+
 
 class TestIIterEx(TestCase):
 
@@ -88,8 +102,7 @@ class TestIIterEx(TestCase):
             return obj % 2 == 0
 
         new_list = [i for i in range(1, 100)]
-        for idx, item in enumerate(iiterex(new_list, callback=callback)):
-            self.assertTrue(item % 2 == 0)
+        self.assertListEqual(list(iiterex(new_list, callback=callback)), list(range(2, 100, 2)))
 
     def test_callback_modifyobject(self):
         """
@@ -141,6 +154,22 @@ class TestIIterEx(TestCase):
 
         self.assertEqual(count, old_div(len(new_list), 15))
 
+    def test_declaritive_callback_missing_attribute(self):
+        """ Validate that an attribute specific callback is only applied to objects which have that attribute.
+        :return:
+        """
+        class dummy(object):
+            """ Dummy class
+            """
+            def __init__(self, a):
+                self.a = a
+
+        new_list = [dummy(i) for i in range(1, 10)]
+        new_list[0].b = 1
+
+        result = list(iiterex(new_list, b_callback=lambda b: b != 1))
+        self.assertEqual(result, new_list[1:])
+
     def test_wrapping_object_attr_in_interable(self):
         """ Validates and documents method for wrapping an object's attribute so that it becomes iterable.
         :return:
@@ -177,86 +206,73 @@ class TestIBatch(TestCase):
         """Validates that ibatch returns expected items when given an iterable
         """
         new_list = [i for i in range(100)]
-        x = 0
-        for idx, item in enumerate(ibatch(new_list)):
-            self.assertEquals(idx, x)
-            self.assertEquals(item, x)
-            x += 1
-
-        self.assertEquals(x, len(new_list))
+        self.assertListEqual(list(ibatch(new_list)), new_list)
 
     def test_yields_items_chunk_size(self):
         """Validates that ibatch returns expected items when given an iterable
         """
         new_list = [i for i in range(100)]
-        x = 0
+        for chunk_size in (5, 3):
+            self.assertListEqual(list(ibatch(new_list, chunk_size=chunk_size)), new_list)
 
-        for idx, item in enumerate(ibatch(new_list, chunk_size=5)):
-            self.assertEquals(x, idx)
-            self.assertEquals(x, item)
-            x += 1
-        self.assertEquals(x, len(new_list))
+    def test_slices_by_chunk(self):
+        """Validates that ibatch slices the iterable a chunk at a time and does not slice past a short final chunk
+        """
+        slices = []
+
+        class SliceRecordingList(list):
+            def __getitem__(self, item):
+                slices.append((item.start, item.stop))
+                return super(SliceRecordingList, self).__getitem__(item)
 
-        x = 0
-        for idx, item in enumerate(ibatch(new_list, chunk_size=3)):
-            self.assertEquals(x, idx)
-            self.assertEquals(x, item)
-            x += 1
-        self.assertEquals(x, len(new_list))
+        self.assertEqual(list(ibatch(SliceRecordingList(range(7)), chunk_size=3)), list(range(7)))
+        self.assertEqual(slices, [(0, 3), (3, 6), (6, 9)])
 
 
 class IndexOfTestCase(TestCase):
     """Tests for the index_of method
     """
+    FIRST_ONLY_TEST_CASES = (
+        # (iterable, predicate function, expected_idx)
+        ([0, 1, 2, 1], lambda x: x == 1, 1),
+        ([{"a": 0}, {"a": 1}, {"a": 2}, {"a": 1}], lambda x: x["a"] == 1, 1),
+
+        # Validate the correct behavior if the predicate matches nothing
+        ([0, 1, 2, 1], lambda x: x == 3, None),
+        ([{"a": 0}, {"a": 1}, {"a": 2}, {"a": 1}], lambda x: x["a"] == 3, None),
+
+        # Validate it works with a generator as well
+        (range(3), lambda x: x == 1, 1),
+    )
+
+    ALL_MATCHES_TEST_CASES = (
+        # (iterable, predicate function, expected_idx)
+        ([0, 1, 2, 1], lambda x: x == 1, [1, 3]),
+        ([0, 1, 2, 1], lambda x: x == 2, [2]),
+        ([{"a": 0}, {"a": 1}, {"a": 2}, {"a": 1}], lambda x: x["a"] == 1, [1, 3]),
+
+        # Validate the correct behavior if the predicate matches nothing
+        ([0, 1, 2, 1], lambda x: x == 3, None),
+        ([{"a": 0}, {"a": 1}, {"a": 2}, {"a": 1}], lambda x: x["a"] == 3, None),
+    )
+
     def test_index_of_first_only_true(self):
         """Validates the behavior of index_of when matching for only the first index within an iterable
         """
-        ### SETUP
-        TEST_CASES = [
-            # (iterable, predicate function, expected_idx)
-            ([0, 1, 2, 1], lambda x: x == 1, 1),
-            ([{"a": 0}, {"a": 1}, {"a": 2}, {"a": 1}], lambda x: x["a"] == 1, 1),
-
-            # Validate the correct behavior if the predicate matches nothing
-            ([0, 1, 2, 1], lambda x: x == 3, None),
-            ([{"a": 0}, {"a": 1}, {"a": 2}, {"a": 1}], lambda x: x["a"] == 3, None),
-
-            # Validate it works with a generator as well
-            (range(3), lambda x: x == 1, 1),
-        ]
-
-        self._do_index_of_test_cases(TEST_CASES, True)
+        self._do_index_of_test_cases(self.FIRST_ONLY_TEST_CASES, True)
 
     def test_index_of_first_only_false(self):
         """Validates the behavior of index_of when matching for multiple indices within an iterable
         """
-        ### SETUP
-        TEST_CASES = [
-            # (iterable, predicate function, expected_idx)
-            ([0, 1, 2, 1], lambda x: x == 1, [1, 3]),
-            ([0, 1, 2, 1], lambda x: x == 2, [2]),
-            ([{"a": 0}, {"a": 1}, {"a": 2}, {"a": 1}], lambda x: x["a"] == 1, [1, 3]),
-
-            # Validate the correct behavior if the predicate matches nothing
-            ([0, 1, 2, 1], lambda x: x == 3, None),
-            ([{"a": 0}, {"a": 1}, {"a": 2}, {"a": 1}], lambda x: x["a"] == 3, None),
-        ]
-
-        self._do_index_of_test_cases(TEST_CASES, False)
+        self._do_index_of_test_cases(self.ALL_MATCHES_TEST_CASES, False)
 
     def _do_index_of_test_cases(self, test_cases, first_only):
-        test_case_idx = 0
-        for iterable, predicate, expected_idx in test_cases:
+        for test_case_idx, (iterable, predicate, expected_idx) in enumerate(test_cases):
             log.debug("Executing test case %d with iterable %s and expected_idx %s",
                       test_case_idx, iterable, expected_idx)
-            try:
-                idx = index_of(iterable, predicate, first_only=first_only)
-                if isinstance(expected_idx, list):
-                    self.assertListEqual(idx, expected_idx)
-                else:
-                    self.assertEqual(idx, expected_idx)
-            except ValueError:
-                if expected_idx is not None:
-                    raise
-
-            test_case_idx += 1
+            msg = "index_of test case %d failed" % test_case_idx
+            if expected_idx is None:
+                with self.assertRaises(ValueError, msg=msg):
+                    index_of(iterable, predicate, first_only=first_only)
+            else:
+                self.assertEqual(index_of(iterable, predicate, first_only=first_only), expected_idx, msg)
@@ -4,7 +4,7 @@ from unittest import TestCase
 from generic_utils import loggingtools
 from generic_utils.datetimetools import utcnow
 from generic_utils.json_tools import serialization
-from generic_utils.test.datetime_utils import EST
+from generic_utils.test.datetime_utils import EST_TZ
 
 log = loggingtools.getLogger()
 
@@ -55,7 +55,7 @@ class BidirectionalSerializationTestCase(TestCase):
             # Validate that correct time value survives serialization for a non-utc datetime;  Note that while the
             # absolute datetime relative to UTC will be maintained, the tzinfo is currently lost such that this fails:
             # self.assertEqual(deserialized["eastern_datetime"].tzinfo, orig_obj["eastern_datetime"].tzinfo)
-            "eastern_datetime": utcnow().astimezone(EST()),
+            "eastern_datetime": utcnow().astimezone(EST_TZ),
             "date": utcnow().date()
         }
 
@@ -80,3 +80,15 @@ class BidirectionalSerializationTestCase(TestCase):
 
         ### VALIDATION
         self.assertEqual(obj_instance, deserialized)
+
+    def test_repeated_arbitrary_class(self):
+        """Validates that several instances of the same class in one document are all deserialized
+        """
+        ### SETUP
+        orig_obj = [MySerializationObject(idx) for idx in range(3)]
+
+        ### EXECUTION
+        deserialized = serialization.loads(serialization.dumps(orig_obj))
+
+        ### VALIDATION
+        self.assertEqual(orig_obj, deserialized)
@@ -28,6 +28,8 @@ class UpdateJsonTestCase(TestCase):
         self.assertEquals(ju.path_query({'a': {'b': 2}}, ['a']), {'b': 2})
         self.assertEquals(ju.path_query({'a': {'b': 2}}, ['a', 'b']), 2)
         self.assertIsNone(ju.path_query({'a': {'b': 2}}, ['a', 'b', 'c']))
+        self.assertEqual(ju.path_query({'a': {'b': 2}}, ['a', 'c'], default_val=0), 0)
+        self.assertEqual(ju.path_query({'a': {'b': 2}}, ['a', 'b', 'c'], default_val=0), 0)
 
     def test_increment_json_value_from_path(self):
         # increment_json_value_from_path(json_struct, path, value)
@@ -38,6 +40,8 @@ class UpdateJsonTestCase(TestCase):
         self.assertEqual(json_struct, {'a': {'b': 6}})
         json_struct = ju.increment_json_value_from_path(json_struct, 'a.b', -5)
         self.assertEqual(json_struct, {'a': {'b': 1}})
+        json_struct = ju.increment_json_value_from_path(json_struct, 'a.c', 3)
+        self.assertEqual(json_struct, {'a': {'b': 1, 'c': 3}})
 
     def test_query_json_struct_from_path(self):
         self.assertEquals(ju.query_json_struct_from_path({'a': {'b': 2}}, 'a.b'), 2)
@@ -82,6 +86,10 @@ class UpdateJsonTestCase(TestCase):
         json_struct = {'a': [1]}
         self.assertEquals(ju.update_json_struct_add(json_struct, ['a'], [2, 3]), {'a': [1, 2, 3]})
         self.assertEquals(ju.update_json_struct_add(json_struct, ['a'], [2, 3]), {'a': [1, 2, 3]})
+        self.assertEqual(json_struct, {'a': [1]}, "The original list should not be extended in place")
+
+        json_struct = {'a': [3, 1, 3]}
+        self.assertEqual(ju.update_json_struct_add(json_struct, ['a'], [2, 1]), {'a': [3, 1, 2]})
 
     def test_update_json_struct_from_path(self):
         """
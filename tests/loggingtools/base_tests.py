@@ -1,4 +1,5 @@
 # stdlib
+from socket import socket
 from unittest import TestCase
 
 from mock import patch
@@ -69,9 +70,25 @@ class SysLogHandlerTestCases(TestCase):
         for tags, msg, expected_msg, tag_delimiter in test_message_configs:
             self._test_log_messages_with_tags(msg, expected_msg, tags, tag_delimiter)
 
-    def _test_log_messages_with_tags(self, msg, expected_msg, tags=None, tag_delimiter=None):
-        from socket import socket
+    def test_sysloghandler_tags_updated(self):
+        """Validate that changing the tags or delimiter of an existing handler is reflected in formatted messages
+        """
+        handler = loggingtools.SysLogHandler(self.syslog_address, tags=["blah"])
+        try:
+            self.assertEqual(handler._add_tags_to_msg("my message"), "blah: my message")
+
+            handler.tags = ["blah", "yo"]
+            self.assertEqual(handler._add_tags_to_msg("my message"), "blah-yo: my message")
 
+            handler.tag_delimiter = "~"
+            self.assertEqual(handler._add_tags_to_msg("my message"), "blah~yo: my message")
+
+            handler.tags.append("x")
+            self.assertEqual(handler._add_tags_to_msg("my message"), "blah~yo~x: my message")
+        finally:
+            handler.close()
+
+    def _test_log_messages_with_tags(self, msg, expected_msg, tags=None, tag_delimiter=None):
         # SETUP
         self.log.debug("setting up handler with %s %s.", tags, tag_delimiter)
         handler = loggingtools.SysLogHandler(self.syslog_address, tags=tags if tags else [],
@@ -81,7 +98,7 @@ class SysLogHandlerTestCases(TestCase):
         # method call fails if args and kwargs are not defined in the method sig
         def check_format_return(return_value, *args, **kwargs):
             # VALIDATE
-            self.assertEquals(return_value, expected_msg)
+            self.assertEqual(return_value, expected_msg)
 
         # pylint: enable=unused-argument
 
@@ -90,12 +107,10 @@ class SysLogHandlerTestCases(TestCase):
         self.test_log.addHandler(handler)
 
         try:
-            # patch all socket send methods so that this test message isn't actually logged.
+            # patch the socket send method so that this test message isn't actually logged.
             # Would patch the .emit() fnc, except that it is responsible for calling the format method we are spying.
             with \
                     SpyObject(handler, "format", cb_post_func=check_format_return) as handler_format_fnc, \
-                    patch.object(socket, "send", return_value=None), \
-                    patch.object(socket, "send", return_value=None), \
                     patch.object(socket, "send", return_value=None):
 
                 self.test_log.warn(msg)
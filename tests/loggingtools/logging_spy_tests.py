@@ -0,0 +1,35 @@
+"""Tests for generic_utils.loggingtools.test_utils"""
+# stdlib
+import logging
+
+from generic_utils.loggingtools.test_utils import LoggingSpy
+from generic_utils.test import TestCase
+
+SPY_LOGGER_NAME = "generic_utils.tests.logging_spy"
+
+
+class LoggingSpyTestCase(TestCase):
+    """Validates the message matching of LoggingSpy.assert_log"""
+
+    def test_assert_log_anchored_literal(self):
+        """Validate anchored literal patterns only match the exact message
+        """
+        log = logging.getLogger(SPY_LOGGER_NAME)
+        with LoggingSpy(loggers=[SPY_LOGGER_NAME]) as log_spy:
+            log.warning("Test")
+            log.warning("Test\n")
+            log.warning("Testing")
+
+        log_spy.assert_log("^Test$", expected_count=2, expect_exact_count=True)
+        with self.assertRaises(AssertionError):
+            log_spy.assert_log("^Tes$")
+
+    def test_assert_log_regex(self):
+        """Validate patterns containing regex syntax are still matched as regular expressions
+        """
+        log = logging.getLogger(SPY_LOGGER_NAME)
+        with LoggingSpy(loggers=[SPY_LOGGER_NAME]) as log_spy:
+            log.warning("Test %d", 42)
+
+        log_spy.assert_log(r"^Test \d+$", level=logging.WARNING, logger=SPY_LOGGER_NAME)
+        log_spy.assert_log("Test")
@@ -53,6 +53,14 @@ class LevelOverrideComparisonTestCases(TestCase):
             self.assertFalse(left > right)
             self.assertFalse(left < right)
 
+    def test_no_instance_dict(self):
+        """LevelOverride declares __slots__, so no per instance __dict__ should be allocated
+        """
+        level_override = LevelOverride(logging.DEBUG)
+        self.assertFalse(hasattr(level_override, "__dict__"))
+        with self.assertRaises(AttributeError):
+            level_override.unknown_attribute = True
+
 
 class LogLevelProviderTestCases(TestCase):
     """Test cases which validate the behavior of the base LogLevelProvider class as well as the InMemoryLogLevelProvider
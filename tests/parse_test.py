@@ -55,6 +55,15 @@ class TestSplitByIndex(TestCase):
         self.assertEquals(v5, 'mno')
         self.assertEquals(rem, 'p')
 
+    def test_non_iterator_bytes(self):
+        self.assertEqual(split_by_size(b'abcdefghijklmnop', 3), (b'abc', b'def', b'ghi', b'jkl', b'mno'))
+        self.assertEqual(split_by_size(b'abcdefghijklmnop', 3, return_remainder=True),
+                         (b'abc', b'def', b'ghi', b'jkl', b'mno', b'p'))
+        self.assertEqual(split_by_size(b'ab', 3, return_remainder=True), (b'ab',))
+
+    def test_sizes_past_end(self):
+        self.assertEqual(split_by_size('abc', [2, 5, 1], return_remainder=True), ('ab', 'c', '', ''))
+
 
 class VersiontupleTestCase(TestCase):
     def test_basic_usage(self):
@@ -70,3 +70,30 @@ class CacheStatsClientTestCase(TestCase):
             self.assertEqual(statsd_client.cache['setval|set'], [[12, 1]])
             self.assertEqual(statsd_client.cache['decr|count'], [[-1, 1]])
             self.assertEqual(statsd_client.cache['gauge|gauge'], [[10, 1]])
+
+    def test_reset(self):
+        """Validates that resetting a TestCaseStatsClient clears the captured metrics in place
+        """
+        statsd_client = TestCaseStatsClient()
+        cache = statsd_client.cache
+        timings = statsd_client.timings
+        statsd_client.incr("incr")
+        statsd_client.timing("timing", 10)
+
+        statsd_client.reset()
+
+        self.assertIs(statsd_client.cache, cache)
+        self.assertIs(statsd_client.timings, timings)
+        self.assertEqual(statsd_client.cache, {})
+        self.assertEqual(statsd_client.timings, [])
+
+    def test_timing_batch(self):
+        """Validates that TestCaseStatsClient.timing_batch records every entry against the same completion time
+        """
+        statsd_client = TestCaseStatsClient()
+
+        statsd_client.timing_batch([("first", 10), ("second", 20)])
+
+        self.assertEqual([timing[0] for timing in statsd_client.timings], ["first|timing", "second|timing"])
+        self.assertEqual([timing[2] for timing in statsd_client.timings], [10, 20])
+        self.assertEqual(statsd_client.timings[0][3], statsd_client.timings[1][3])
@@ -1,3 +1,4 @@
+import six
 from nose.plugins.attrib import get_method_attr
 
 from generic_utils.test import JIRA_ATTR_NAME
@@ -100,3 +101,102 @@ class TestGeneratorDecoratorTestCase(TestCase):
         validate the appropriate number of tests were generated and executed.
         """
         self.assertEqual(generator_with_func_count, 11)
+
+
+class CustomSetupBaseTestCase(TestCase):
+    custom_setup_count = 0
+    custom_teardown_count = 0
+
+    def _custom_setup(self):
+        self.custom_setup_count += 1
+
+    def _custom_teardown(self):
+        self.custom_teardown_count += 1
+
+    def setUp(self):
+        self.setup_count = 1
+
+
+class CustomSetupTestCase(CustomSetupBaseTestCase):
+    def setUp(self):
+        super(CustomSetupTestCase, self).setUp()
+        self.setup_count += 1
+
+    def tearDown(self):
+        super(CustomSetupTestCase, self).tearDown()
+        self.assertEqual(self.custom_teardown_count, 1)
+
+    def test_custom_setup_called_once(self):
+        """Validates that _custom_setup is called a single time when the setUp of a TestCase calls the setUp of a parent
+        TestCase and that the current test case is tracked
+        """
+        self.assertEqual(self.setup_count, 2)
+        self.assertEqual(self.custom_setup_count, 1)
+        self.assertIs(TestCase.get_current_test_case(), self)
+
+    def test_setup_wrapped_on_class(self):
+        """Validates that setUp is wrapped once on the class with a plain function rather than per instance"""
+        setup = six.get_unbound_function(type(self).setUp)
+        self.assertIs(setup._wrapped_core_test_method, CustomSetupTestCase.__dict__["setUp"]._wrapped_core_test_method)
+        self.assertNotIn("setUp", self.__dict__)
+
+
+
+class CustomSetupAttributeErrorTestCase(TestCase):
+    def _custom_setup(self):
+        raise AttributeError("_custom_setup")
+
+    def _custom_teardown(self):
+        raise AttributeError("_custom_teardown")
+
+    def test_custom_hook_attribute_error_ignored(self):
+        """Validates that an AttributeError raised from _custom_setup/_custom_teardown, such as by a mixin calling a
+        parent hook which does not exist, is ignored and the current test case is still tracked
+        """
+        self.assertIs(TestCase.get_current_test_case(), self)
+
+
+class LateEnabledOverrideTestCase(CustomSetupBaseTestCase):
+    override_enabled = False
+
+    @classmethod
+    def _enable_test_method_override(cls):
+        return cls.override_enabled
+
+    def test_override_enabled_after_class_creation(self):
+        """Validates that _enable_test_method_override is consulted when the test runs rather than when the class is
+        created
+        """
+        self.assertEqual(self.custom_setup_count, 1)
+        self.assertIs(TestCase.get_current_test_case(), self)
+
+
+LateEnabledOverrideTestCase.override_enabled = True
+
+class DataDecoratorTestCase(TestCase):
+    @jira("DJUTILS-3")
+    @data(1, 2)
+    def test_data(self, val):
+        """Validates value {0}
+        """
+        self.assertIn(val, (1, 2))
+
+    def test_generated_tests(self):
+        """Validates that the tests generated for single data values keep the name, docstring and attributes of the
+        decorated test
+        """
+        generated_test = getattr(self, "test_data_2_2")
+        self.assertEqual(generated_test.__name__, "test_data_2_2")
+        self.assertEqual(generated_test.__doc__.strip(), "Validates value 2")
+        self.assertEqual(getattr(generated_test, JIRA_ATTR_NAME), ("DJUTILS-3",))
+        self.assertFalse(hasattr(self, "test_data"))
+
+
+class DataDecoratorSubclassTestCase(DataDecoratorTestCase):
+    def test_inherited_generated_tests(self):
+        """Validates that the tests generated on the parent are inherited as is rather than being expanded again for
+        the subclass
+        """
+        self.assertNotIn("test_data_2_2", type(self).__dict__)
+        self.assertIs(six.get_unbound_function(type(self).test_data_2_2),
+                      DataDecoratorTestCase.__dict__["test_data_2_2"])
@@ -1,5 +1,7 @@
 """Tests for generic_utils.test.mock.tools"""
 # stdlib
+import os
+import tempfile
 from functools import reduce
 from unittest import TestCase
 
@@ -89,6 +91,13 @@ class SpyObjectTestCase(TestCase):
         self.assertEqual(cb_post_param_dict["args"], tuple([instance] + list(ADD_ARGS)))
         self.assertEqual(cb_post_param_dict["kwargs"], {})
 
+    def test_illegal_mock_kwargs(self):
+        """Validates that the illegal mock kwargs are dropped while the other mock kwargs are kept
+        """
+        mock_kwargs = {"autospec": False, "side_effect": None, "some_kwarg": "bleh"}
+        spy = spy_object(MyTestObject, "add", mock_kwargs=mock_kwargs)
+        self.assertEqual(spy.mock_kwargs, {"some_kwarg": "bleh"})
+
     def test_property_spying(self):
         # Not currently supporting property spying as there are some subtleties that need to be worked out.  Waiting for
         # a real need on this
@@ -111,4 +120,16 @@ class PatchUrlopenWithFileTestCase(TestCase):
                 LOG.debug("urlopen={0}.{1}".format(urllib2.urlopen.__module__, urllib2.urlopen.func_name))
                 response = urllib2.urlopen("http://example.com")
                 self.assertEqual(response.read(), self.test_file_content)
-                mocked_open.assert_called_with("dummy_filename", "r")
+                mocked_open.assert_called_with("dummy_filename", "r", buffering=-1)
+
+    def test_patch_urlopen_with_real_file(self):
+        """Validate that the patch_urlopen_with_file context manager serves the contents of an actual file
+        """
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as test_file:
+            test_file.write(self.test_file_content)
+        try:
+            with patch_urlopen_with_file(test_file.name):
+                response = urllib2.urlopen("http://example.com")
+                self.assertEqual(response.read(), self.test_file_content)
+        finally:
+            os.remove(test_file.name)
@@ -0,0 +1,40 @@
+from generic_utils.test import nose_utils
+
+from .decorators_tests import AttrTestCase
+
+
+class NoseAttrDecoratorTestCase(AttrTestCase):
+    TEST_ATTR = "custom_attr"
+
+    def test_nose_attr_decorator(self):
+        """Validates that a decorator generated by `nose_attr_decorator` can be used with or without args
+        """
+        custom_attr = nose_utils.nose_attr_decorator(self.TEST_ATTR)
+
+        @custom_attr
+        def some_test():
+            pass
+
+        @custom_attr("a", "b")
+        def some_test_with_args():
+            pass
+
+        self.assertEqual(self._get_attr(some_test), ())
+        self.assertEqual(self._get_attr(some_test_with_args), ("a", "b"))
+
+    def test_specialize_attr_decorator(self):
+        """Validates that a decorator generated by `specialize_attr_decorator` applies its curried args with or without
+        being called
+        """
+        custom_attr = nose_utils.specialize_attr_decorator(nose_utils.nose_attr_decorator(self.TEST_ATTR), "a")
+
+        @custom_attr
+        def some_test():
+            pass
+
+        @custom_attr()
+        def some_test_with_args():
+            pass
+
+        self.assertEqual(self._get_attr(some_test), ("a",))
+        self.assertEqual(self._get_attr(some_test_with_args), ("a",))
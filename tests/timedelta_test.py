@@ -0,0 +1,13 @@
+# stdlib
+import datetime
+from unittest import TestCase
+
+from generic_utils import timedelta
+
+
+class GetTotalSecondsTestCase(TestCase):
+    def test_get_total_seconds(self):
+        """Validates that `get_total_seconds` includes the days, seconds and microseconds of the timedelta
+        """
+        delta = datetime.timedelta(days=1, seconds=2, microseconds=500000)
+        self.assertEqual(timedelta.get_total_seconds(delta), 86402.5)
@@ -5,7 +5,9 @@ from builtins import range
 from unittest import TestCase
 
 from generic_utils import loggingtools
+from generic_utils.typetools import as_iterable
 from generic_utils.typetools import is_iterable
+from generic_utils.typetools import parse_bool
 
 log = loggingtools.getLogger(__name__)
 
@@ -18,7 +20,9 @@ class GeneralTestCase(TestCase):
             (1, 2),
             [1, 2],
             [x for x in range(2)],
-            {"test": 1}
+            {"test": 1},
+            set([1, 2]),
+            (x for x in range(2))
         ]
 
         non_iterables = [
@@ -36,3 +40,23 @@ class GeneralTestCase(TestCase):
         for non_iterable in non_iterables:
             log.debug("Testing non_iterable %s", non_iterable)
             self.assertFalse(is_iterable(non_iterable))
+
+    def test_parse_bool(self):
+        """Validates the behavior of the `parse_bool` method
+        """
+        for true_value in ["TRUE", "true", "Yes", "1", "t"]:
+            self.assertTrue(parse_bool(true_value), true_value)
+
+        for false_value in ["FALSE", "no", "0", "", "bogus", None, 1, True]:
+            self.assertFalse(parse_bool(false_value), false_value)
+
+    def test_as_iterable(self):
+        """Validates the behavior of the `as_iterable` method
+        """
+        iterable = (1, 2)
+        self.assertIs(as_iterable(iterable), iterable)
+        self.assertEqual(as_iterable(None), [])
+        self.assertEqual(as_iterable(1), [1])
+        self.assertEqual(as_iterable("test"), ["test"])
+        self.assertEqual(as_iterable("test", exclude_string=False), "test")
+        self.assertEqual(as_iterable(1, iter_type=tuple), (1,))
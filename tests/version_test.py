@@ -4,6 +4,8 @@ from builtins import str
 from builtins import zip
 
 # stdlib
+import calendar
+import datetime
 import hashlib
 import inspect
 import os
@@ -44,6 +46,12 @@ class TestVersion(TestCase):
         self.assertEqual(v.__unicode__(), "0.01.02 - Build 99")
         self.assertEqual(v.build, 99)
 
+    def test_version_info_cached(self):
+        """Validates that repeated lookups of a module version return equal but distinct `Version` instances"""
+        v = versioninfo.get_module_version('tests.test_version_module.without_build_info')
+        self.assertIsNot(v, self.v)
+        self.assertEqual(v, self.v)
+
     def test_future_version(self):
         # Set release_day_of_week explicitly to Tuesday
         v = Version(major=0, year=13, week=47, patch=5)
@@ -78,6 +86,14 @@ class TestVersion(TestCase):
         self.assertVersionsEqual(v.get_future_version(release=2),
                                  Version(major=0, year=16, week=0o1, patch=0))
 
+    def test_is_long_year(self):
+        """Validates that `_is_long_year` matches the weekday of the first day of the year as computed by datetime
+        """
+        for year in range(1, 2500):
+            weekday = datetime.date(year, 1, 1).weekday()
+            expected = weekday == versioninfo.WEDNESDAY if calendar.isleap(year) else weekday == versioninfo.THURSDAY
+            self.assertEqual(Version._is_long_year(year), expected, year)
+
     def test_version_compare(self):
         """Validates that all comparisons for a Version work as expected.  This includes a Version to Version comparison
         as well as Version to Version String comparisons